@@ -0,0 +1,374 @@
+"""
+========================================
+BENCHMARKS - SMART LOST & FOUND PORTAL
+========================================
+Times the portal's hot paths on seeded synthetic data and prints one
+JSON object per measurement, so runs can be compared between versions.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --sizes 1000 10000 100000 1000000 --output bench.jsonl
+    python benchmark.py --sizes 100000 --only match_vectorized load_data
+    python benchmark.py --memory --sizes 100000 1000000
+"""
+
+import argparse
+import builtins
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import test_3 as portal
+
+DEFAULT_SIZES = [1000, 10000]
+
+ITEM_NAMES = [
+    "iPhone 13", "Samsung Galaxy", "Blue Backpack", "Black Wallet", "Student ID Card",
+    "Water Bottle", "Calculus Textbook", "Red Umbrella", "Laptop Charger", "AirPods Case",
+    "Silver Watch", "Grey Hoodie", "Gold Ring", "USB Drive", "Spiral Notebook",
+    "Room Keys", "Lab Coat", "Scientific Calculator", "Sunglasses", "Headphones"
+]
+CATEGORIES = ['Electronics', 'Clothing', 'Documents', 'Books', 'Accessories', 'Others']
+COLORS = ["Black", "Blue", "Red", "Silver", "White", "Green", "Grey", "Brown"]
+MATERIALS = ["Leather", "Plastic", "Metal", "Fabric", "Paper", "Glass"]
+LOCATIONS = ["Library", "SJT", "TT", "Food Court", "Main Gate", "MB", "Gym", "Hostel A"]
+CLAIM_STATUSES = ["Claim Request Submitted", "Claim Verified", "Not Verified",
+                  "Collect From SWF Office", "Claimed", "Claim Rejected"]
+
+# ==================== SYNTHETIC DATA ====================
+
+def _item_details(rng):
+    """Fields produced by get_item_questionnaire()"""
+    name = rng.choice(ITEM_NAMES)
+    if rng.random() < 0.3:
+        name = f"{rng.choice(COLORS)} {name}"
+    category = rng.choice(CATEGORIES)
+    color = rng.choice(COLORS)
+    material = rng.choice(MATERIALS)
+    batch_id = f"SN{rng.randrange(10**6):06d}" if rng.random() < 0.4 else ""
+    notes = "Has a sticker on the back" if rng.random() < 0.2 else ""
+    return portal.build_item_details(name, category, color, material, batch_id, notes)
+
+def generate_dataset(size, seed=42):
+    """
+    Build a dataset with `size` item reports (half lost, half found),
+    plus clients and claims, using the portal's record schema
+    """
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+
+    def random_date():
+        return (start + timedelta(days=rng.randrange(365))).strftime("%Y-%m-%d")
+
+    clients = []
+    for client_id in range(1, max(10, size // 20) + 1):
+        clients.append({
+            'client_id': client_id,
+            'username': f"student{client_id}",
+            'password_hash': portal.hash_password(f"pass{client_id}"),
+            'name': f"Student {client_id}",
+            'contact': f"9{rng.randrange(10**9):09d}",
+            'email': f"student{client_id}@vitstudent.ac.in",
+            'registration_date': random_date()
+        })
+
+    lost_items = []
+    for item_id in range(1, size // 2 + 1):
+        reporter = rng.choice(clients)
+        item = {'id': item_id}
+        item.update(_item_details(rng))
+        item.update({
+            'location': rng.choice(LOCATIONS),
+            'date_lost': random_date(),
+            'status': 'closed' if rng.random() < 0.3 else 'open',
+            'reporter_username': reporter['username'],
+            'reporter_name': reporter['name'],
+            'reporter_contact': reporter['contact']
+        })
+        lost_items.append(item)
+
+    found_items = []
+    for item_id in range(1, size - size // 2 + 1):
+        finder = rng.choice(clients)
+        item = {'id': item_id}
+        item.update(_item_details(rng))
+        item.update({
+            'location': rng.choice(LOCATIONS),
+            'date_found': random_date(),
+            'status': 'claimed' if rng.random() < 0.2 else 'available',
+            'finder_username': finder['username'],
+            'finder_name': finder['name'],
+            'finder_contact': finder['contact']
+        })
+        found_items.append(item)
+
+    claims = []
+    for claim_id in range(1, max(1, size // 10) + 1):
+        claimant = rng.choice(clients)
+        claims.append({
+            'claim_id': claim_id,
+            'found_item_id': rng.randrange(1, len(found_items) + 1),
+            'claimant_username': claimant['username'],
+            'claimant_name': claimant['name'],
+            'claimant_contact': claimant['contact'],
+            'claim_date': random_date(),
+            'status': rng.choice(CLAIM_STATUSES),
+            'proof_description': "Black cover with my initials scratched inside",
+            'admin_notes': ''
+        })
+
+    return {'lost': lost_items, 'found': found_items, 'claims': claims, 'clients': clients}
+
+def to_records(data):
+    """Convert a generated dataset to the portal's slotted record types"""
+    return {table: [portal.RECORD_TYPES[table].from_dict(row) for row in rows]
+            for table, rows in data.items()}
+
+def install_dataset(data):
+    """Make a generated dataset the portal's in-memory state"""
+    portal.lost_items = data['lost']
+    portal.found_items = data['found']
+    portal.claims = data['claims']
+    portal.clients = data['clients']
+    portal.lost_id_counter = len(data['lost']) + 1
+    portal.found_id_counter = len(data['found']) + 1
+    portal.claim_id_counter = len(data['claims']) + 1
+    portal.client_id_counter = len(data['clients']) + 1
+    portal.current_client = data['clients'][0]
+    portal.rebuild_indexes()
+    portal.reset_match_table()
+
+# ==================== HARNESS ====================
+
+@contextlib.contextmanager
+def scripted_input(*answers):
+    """Feed answers to input() (then Enter forever) and swallow screen output"""
+    pending = list(answers)
+    original_input = builtins.input
+    builtins.input = lambda prompt='': pending.pop(0) if pending else ''
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original_input
+
+def time_call(func, repeat):
+    """Best wall-clock time of func() over `repeat` runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def _screen(func, *answers):
+    """Run an interactive screen with scripted answers"""
+    def run():
+        with scripted_input(*answers):
+            func()
+    return run
+
+def _no_charts(func, *answers):
+    """Run an analytics screen without rendering charts"""
+    def run():
+        original = portal.generate_charts
+        portal.generate_charts = lambda *args, **kwargs: None
+        try:
+            _screen(func, *answers)()
+        finally:
+            portal.generate_charts = original
+    return run
+
+def _pdf():
+    """PDF report screen plus the background build; raises ImportError up front if reportlab is missing"""
+    import reportlab  # noqa: F401  (generate_pdf_report() swallows errors)
+    _screen(portal.generate_pdf_report)()
+    with contextlib.redirect_stdout(io.StringIO()):
+        portal.wait_for_reports()
+
+def _save():
+    """save_data() without the status message"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        portal.save_data()
+
+def _load():
+    """load_data() without the status message"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        portal.load_data()
+
+def _write_data_files():
+    """Write the installed dataset to fresh CSV snapshots with an empty journal"""
+    portal.compact_journal()
+
+def benchmarks():
+    """Benchmark name -> zero-argument callable, run against the installed dataset"""
+    return {
+        'match_blocked': lambda: portal.run_matching('blocked'),
+        'match_vectorized': lambda: portal.run_matching('vectorized'),
+        'match_parallel': lambda: portal.run_matching('parallel'),
+        'match_top_k': lambda: portal.find_top_matches(),
+        'search_name': _screen(portal.client_search_items, '1', 'phone'),
+        'search_category': _screen(portal.client_search_items, '2', 'electronics'),
+        'search_color': _screen(portal.client_search_items, '3', 'black'),
+        'search_available': _screen(portal.client_search_items, '4'),
+        'search_description': _screen(portal.client_search_items, '5', 'leather'),
+        'my_reports': _screen(portal.client_view_my_reports),
+        'my_claims': _screen(portal.client_check_claim_status),
+        'save_data': _save,
+        'load_data': _load,
+        'analytics_lost_category': _no_charts(portal.admin_analytics, '1'),
+        'analytics_found_category': _no_charts(portal.admin_analytics, '2'),
+        'analytics_lost_vs_found': _no_charts(portal.admin_analytics, '3'),
+        'analytics_claim_status': _no_charts(portal.admin_analytics, '4'),
+        'pdf_snapshot': portal.report_snapshot,
+        'pdf_report': _pdf
+    }
+
+# Benchmark name -> setup run (untimed) after the dataset is installed
+BENCHMARK_SETUP = {
+    'load_data': _write_data_files
+}
+
+def run(sizes, only=None, skip=(), repeat=3, seed=42, output=None):
+    """Run the suite; returns the list of result records"""
+    results = []
+    meta = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    workdir = tempfile.mkdtemp(prefix="lost_found_bench_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        for size in sizes:
+            start = time.perf_counter()
+            data = to_records(generate_dataset(size, seed))
+            generate_seconds = time.perf_counter() - start
+
+            for name, func in benchmarks().items():
+                if (only and name not in only) or name in skip:
+                    continue
+
+                # Every benchmark starts from the same freshly generated state
+                install_dataset(data)
+                setup = BENCHMARK_SETUP.get(name)
+                if setup:
+                    setup()
+                record = {'benchmark': name, 'size': size, 'repeat': repeat, 'seed': seed}
+                try:
+                    record['seconds'] = round(time_call(func, repeat), 6)
+                except ImportError as e:
+                    record['skipped'] = f"missing dependency: {e.name}"
+                record['generate_seconds'] = round(generate_seconds, 6)
+                record.update(meta)
+                results.append(record)
+
+                line = json.dumps(record)
+                print(line, flush=True)
+                if output:
+                    with open(os.path.join(cwd, output), 'a', encoding='utf-8') as f:
+                        f.write(line + "\n")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+# ==================== MEMORY REPORT ====================
+
+def _traced_bytes(build):
+    """(bytes still allocated once build() returns, peak bytes during it)"""
+    tracemalloc.start()
+    try:
+        result = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current, peak
+
+def memory_report(sizes, seed=42, output=None):
+    """
+    Compare the memory held by the four tables when loaded from CSV as
+    per-row dicts versus the portal's slotted, interned records
+    """
+    results = []
+    workdir = tempfile.mkdtemp(prefix="lost_found_mem_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        for size in sizes:
+            install_dataset(to_records(generate_dataset(size, seed)))
+            portal._write_snapshots()
+            records = sum(len(rows) for rows in
+                          (portal.lost_items, portal.found_items, portal.claims, portal.clients))
+            # Drop the generated tables so only the measured copy is alive
+            portal.lost_items, portal.found_items, portal.claims, portal.clients = [], [], [], []
+            portal.rebuild_indexes()
+            portal.reset_match_table()
+
+            def as_dicts():
+                tables = []
+                for filename in portal.TABLE_FILES.values():
+                    with open(filename, newline='', encoding='utf-8') as f:
+                        tables.append(list(csv.DictReader(f)))
+                return tables
+
+            for layout, build in (('dict', as_dicts), ('slots', portal._read_csv_snapshots)):
+                used, peak = _traced_bytes(build)
+                record = {
+                    'benchmark': f'memory_{layout}',
+                    'size': size,
+                    'records': records,
+                    'bytes': used,
+                    'bytes_per_record': round(used / records, 1),
+                    'peak_bytes': peak,
+                    'python': platform.python_version()
+                }
+                results.append(record)
+                line = json.dumps(record)
+                print(line, flush=True)
+                if output:
+                    with open(os.path.join(cwd, output), 'a', encoding='utf-8') as f:
+                        f.write(line + "\n")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Lost & Found portal's hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="item reports per dataset (default: 1000 10000)")
+    parser.add_argument('--only', nargs='+', choices=sorted(benchmarks()),
+                        help="run only these benchmarks")
+    parser.add_argument('--skip', nargs='+', default=[], choices=sorted(benchmarks()),
+                        help="skip these benchmarks (e.g. match_blocked at 1M)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark, best is kept")
+    parser.add_argument('--seed', type=int, default=42, help="random seed for the data generator")
+    parser.add_argument('--output', help="also append the JSON lines to this file")
+    parser.add_argument('--memory', action='store_true',
+                        help="report table memory (dict rows vs slotted records) instead of timings")
+    args = parser.parse_args()
+
+    if args.memory:
+        memory_report(args.sizes, args.seed, args.output)
+    else:
+        run(args.sizes, args.only, args.skip, args.repeat, args.seed, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -5,20 +5,24 @@ SMART LOST & FOUND PORTAL for VIT
 Developed By (Team Titans)
 """
 
-import pandas as pd
-import numpy as np
+# pandas/numpy, matplotlib and reportlab are imported inside the functions
+# that need them, so the menus come up without paying for those imports
 import csv
+import json
 import datetime
 from datetime import datetime as dt
-import matplotlib.pyplot as plt
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import os
+import sys
+import bisect
+import collections
+import contextlib
+import functools
 import hashlib
+import heapq
+import random
+import sqlite3
+import threading
+import zlib
 
 # ==================== GLOBAL DATA STRUCTURES ====================
 lost_items = []
@@ -35,12 +39,42 @@ client_id_counter = 1
 
 # Session management
 current_client = None  # Stores logged-in client info
+portal_server = None   # PortalClient the client screens work through (kiosk mode), None for local data
+
+# Derived indexes, rebuilt by load_data() and kept current by the mutation helpers
+clients_by_username = {}  # case-folded username -> client record
+lost_by_status = {}   # lower-cased status -> {id: lost item}
+found_by_status = {}  # lower-cased status -> {id: found item}
+lost_by_id = {}    # id -> lost item
+found_by_id = {}   # id -> found item
+claims_by_id = {}  # claim_id -> claim
+records_by_user = {'lost': {}, 'found': {}, 'claims': {}}  # table -> case-folded username -> {id: record}
+trigram_index = {  # table -> field -> trigram -> set of item ids (built on first search)
+    'lost': {'item_name': {}, 'description': {}},
+    'found': {'item_name': {}, 'description': {}}
+}
+trigram_ready = False
+analytics = {}  # table -> dimension -> Counter of values (see ANALYTICS_DIMENSIONS)
+
+# Smart matching candidates, kept current as items are reported and retired
+match_table = {}  # (lost_id, found_id) -> match record
+match_keys = {'lost': {}, 'found': {}}    # active item id -> (item, match key)
+match_blocks = {'lost': {}, 'found': {}}  # blocking key -> set of active item ids
+match_rows = {'lost': {}, 'found': {}}    # item id -> set of match_table keys
+match_dates = {'lost': [], 'found': []}   # sorted (day ordinal, id) of active items
+match_table_ready = False  # Seeded lazily on first use
 
 # ==================== HELPER FUNCTIONS ====================
 
 def clear_screen():
     """Clear terminal screen for better UX"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if not sys.stdout.isatty():
+        return
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # ANSI clear + cursor home, without spawning a shell on every menu loop
+        print("\033[2J\033[H", end="", flush=True)
 
 def print_header(title):
     """Print attractive header"""
@@ -68,6 +102,14 @@ def validate_date(date_str):
     except ValueError:
         return False
 
+@functools.lru_cache(maxsize=4096)
+def date_ordinal(date_str):
+    """Day ordinal of a YYYY-MM-DD date, or None if it does not parse"""
+    try:
+        return dt.strptime(date_str, "%Y-%m-%d").toordinal()
+    except (TypeError, ValueError):
+        return None
+
 def hash_password(password):
     """Hash password using SHA256"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -80,6 +122,41 @@ def verify_password(password, hashed):
 
 # ==================== ITEM QUESTIONNAIRE FUNCTION ====================
 
+CATEGORY_MAP = {
+    'a': 'Electronics', 'b': 'Clothing', 'c': 'Documents',
+    'd': 'Books', 'e': 'Accessories', 'f': 'Others'
+}
+
+def normalize_category(value):
+    """Category for a menu letter (a-f) or a category name; anything else is Others"""
+    value = str(value or '').strip().lower()
+    if value in CATEGORY_MAP:
+        return CATEGORY_MAP[value]
+    for category in CATEGORY_MAP.values():
+        if category.lower() == value:
+            return category
+    return 'Others'
+
+def build_item_details(item_name, category, color, material, batch_id='', additional_notes=''):
+    """Item details in the questionnaire's schema, with the combined description"""
+    item_details = {
+        'item_name': item_name,
+        'category': normalize_category(category),
+        'color': color,
+        'material': material,
+        'batch_id': batch_id if batch_id else "N/A",
+        'additional_notes': additional_notes if additional_notes else "N/A"
+    }
+    
+    # Create comprehensive description from all fields
+    description = f"Category: {item_details['category']}, Color: {item_details['color']}, "
+    description += f"Material: {item_details['material']}, Batch/ID: {item_details['batch_id']}"
+    if item_details['additional_notes'] != "N/A":
+        description += f", Notes: {item_details['additional_notes']}"
+    
+    item_details['description'] = description
+    return item_details
+
 def get_item_questionnaire(item_type="lost"):
     """
     Standard questionnaire for item reporting
@@ -89,111 +166,779 @@ def get_item_questionnaire(item_type="lost"):
     
     print("Please provide the following information about the item:\n")
     
-    item_details = {}
-    
     # 1. Item Name
-    item_details['item_name'] = input("1. Item Name (e.g., iPhone 13, Blue Backpack): ").strip()
+    item_name = input("1. Item Name (e.g., iPhone 13, Blue Backpack): ").strip()
     
     # 2. Category
     print("\n2. Category:")
     print("   a) Electronics   b) Clothing   c) Documents")
     print("   d) Books         e) Accessories f) Others")
     category_choice = input("   Select (a-f): ").strip().lower()
-    category_map = {
-        'a': 'Electronics', 'b': 'Clothing', 'c': 'Documents',
-        'd': 'Books', 'e': 'Accessories', 'f': 'Others'
-    }
-    item_details['category'] = category_map.get(category_choice, 'Others')
+    category = CATEGORY_MAP.get(category_choice, 'Others')
     
     # 3. Color
-    item_details['color'] = input("\n3. Color (e.g., Black, Blue, Red): ").strip()
+    color = input("\n3. Color (e.g., Black, Blue, Red): ").strip()
     
     # 4. Material
-    item_details['material'] = input("\n4. Material (e.g., Leather, Plastic, Metal): ").strip()
+    material = input("\n4. Material (e.g., Leather, Plastic, Metal): ").strip()
     
     # 5. Batch/ID Number
     batch_id = input("\n5. Batch/ID/Serial Number (if any, press Enter to skip): ").strip()
-    item_details['batch_id'] = batch_id if batch_id else "N/A"
     
     # 6. Additional Notes
     notes = input("\n6. Additional Notes (optional, press Enter to skip): ").strip()
-    item_details['additional_notes'] = notes if notes else "N/A"
     
-    # Create comprehensive description from all fields
-    description = f"Category: {item_details['category']}, Color: {item_details['color']}, "
-    description += f"Material: {item_details['material']}, Batch/ID: {item_details['batch_id']}"
-    if item_details['additional_notes'] != "N/A":
-        description += f", Notes: {item_details['additional_notes']}"
-    
-    item_details['description'] = description
+    item_details = build_item_details(item_name, category, color, material, batch_id, notes)
     
     print("\n✓ Item details recorded successfully!")
     
     return item_details
 
+# ==================== RECORD TYPES ====================
+
+# Primary key of each table
+TABLE_KEYS = {'lost': 'id', 'found': 'id', 'claims': 'claim_id', 'clients': 'client_id'}
+
+# Record schema of each table, in column order
+TABLE_FIELDS = {
+    'lost': ['id', 'item_name', 'category', 'color', 'material', 'batch_id',
+             'additional_notes', 'description', 'location', 'date_lost', 'status',
+             'reporter_username', 'reporter_name', 'reporter_contact'],
+    'found': ['id', 'item_name', 'category', 'color', 'material', 'batch_id',
+              'additional_notes', 'description', 'location', 'date_found', 'status',
+              'finder_username', 'finder_name', 'finder_contact'],
+    'claims': ['claim_id', 'found_item_id', 'claimant_username', 'claimant_name',
+               'claimant_contact', 'claim_date', 'status', 'proof_description', 'admin_notes'],
+    'clients': ['client_id', 'username', 'password_hash', 'name', 'contact', 'email',
+                'registration_date']
+}
+
+class Record:
+    """
+    Compact record with one slot per schema field (no per-row dict)
+    Supports the dict-style access used by the portal: record['field'],
+    record.get('field'), 'field' in record, dict(record), update().
+    Low-cardinality text fields are interned so every row shares one copy.
+    """
+    __slots__ = ()
+    FIELDS = ()
+    FIELD_SET = frozenset()
+    INTERNED = frozenset()
+    DATE_FIELD = None  # Field whose day ordinal is cached in the date_ord slot
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELD_SET = frozenset(cls.FIELDS)
+    
+    def __init__(self, **values):
+        for field in self.FIELDS:
+            value = values.get(field, '')
+            if field in self.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            object.__setattr__(self, field, value)
+        if self.DATE_FIELD:
+            object.__setattr__(self, 'date_ord', date_ordinal(getattr(self, self.DATE_FIELD)))
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a mapping; unknown keys are ignored"""
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data})
+    
+    def __getitem__(self, field):
+        if field not in self.FIELD_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def __setitem__(self, field, value):
+        if field not in self.FIELD_SET:
+            raise KeyError(field)
+        if field in self.INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        object.__setattr__(self, field, value)
+        if field == self.DATE_FIELD:
+            object.__setattr__(self, 'date_ord', date_ordinal(value))
+    
+    def __contains__(self, field):
+        return field in self.FIELD_SET
+    
+    def __iter__(self):
+        return iter(self.FIELDS)
+    
+    def __len__(self):
+        return len(self.FIELDS)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+    
+    def get(self, field, default=None):
+        return getattr(self, field) if field in self.FIELD_SET else default
+    
+    def keys(self):
+        return self.FIELDS
+    
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.FIELDS]
+    
+    def update(self, values):
+        for field, value in values.items():
+            self[field] = value
+    
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+# Fields shared by item reports whose values repeat across many rows
+_ITEM_INTERNED = {'category', 'color', 'material', 'batch_id', 'additional_notes',
+                  'location', 'status'}
+
+class LostItem(Record):
+    """A lost item report"""
+    FIELDS = tuple(TABLE_FIELDS['lost'])
+    INTERNED = frozenset(_ITEM_INTERNED | {'date_lost', 'reporter_username',
+                                           'reporter_name', 'reporter_contact'})
+    DATE_FIELD = 'date_lost'
+    __slots__ = FIELDS + ('date_ord',)
+
+class FoundItem(Record):
+    """A found item report"""
+    FIELDS = tuple(TABLE_FIELDS['found'])
+    INTERNED = frozenset(_ITEM_INTERNED | {'date_found', 'finder_username',
+                                           'finder_name', 'finder_contact'})
+    DATE_FIELD = 'date_found'
+    __slots__ = FIELDS + ('date_ord',)
+
+class Claim(Record):
+    """A claim request on a found item"""
+    FIELDS = tuple(TABLE_FIELDS['claims'])
+    INTERNED = frozenset({'claimant_username', 'claimant_name', 'claimant_contact',
+                          'claim_date', 'status', 'admin_notes'})
+    __slots__ = FIELDS
+
+class Client(Record):
+    """A registered client"""
+    FIELDS = tuple(TABLE_FIELDS['clients'])
+    INTERNED = frozenset({'registration_date'})
+    __slots__ = FIELDS
+
+RECORD_TYPES = {'lost': LostItem, 'found': FoundItem, 'claims': Claim, 'clients': Client}
+
+def as_record(table, data):
+    """Return data as the table's record type (records pass through unchanged)"""
+    record_type = RECORD_TYPES[table]
+    if isinstance(data, record_type):
+        return data
+    return record_type.from_dict(data)
+
 # ==================== DATA PERSISTENCE ====================
 
-def load_data():
-    """Load data from CSV files if they exist"""
+# CSV snapshot file and primary key of each table
+TABLE_FILES = {
+    'lost': "lost_items.csv",
+    'found': "found_items.csv",
+    'claims': "claims.csv",
+    'clients': "clients.csv"
+}
+# Storage backend: 'csv' (snapshots + journal) or 'sqlite' (DB_FILE)
+STORAGE_BACKEND = os.environ.get("LOST_FOUND_BACKEND", "csv")
+
+# Write-ahead journal: every mutation is appended here as it happens and
+# folded back into the CSV snapshots by compact_journal()
+JOURNAL_FILE = "journal.jsonl"
+JOURNAL_COMPACT_EVERY = 500  # Journal entries before an automatic compaction
+journal_entries = 0
+
+# Several processes (kiosk sessions, headless commands) may share the data
+# folder, with either backend. They take an advisory lock on DATA_LOCK_FILE
+# around every read or write of the data files or database, and before
+# writing they pick up whatever the others changed since (see sync_from_disk())
+DATA_LOCK_FILE = "lost_found.lock"
+journal_offset = 0       # Bytes of the journal already reflected in memory
+snapshot_version = None  # Snapshot file versions at the last load/save (None: never synced)
+db_version = None        # SQLite data_version at the last load (None: never synced)
+replaying_journal = False  # Set while apply_journal_entry() applies an already journaled change
+
+def _table_rows(table):
+    """Return the in-memory list backing a table"""
+    return {'lost': lost_items, 'found': found_items, 'claims': claims, 'clients': clients}[table]
+
+def _json_default(value):
+    """Serialize records, and NumPy scalars coming from pandas-loaded data"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+# Read snapshots with the csv module (no pandas import); set to False to
+# load them through pandas.read_csv instead
+CSV_FAST_PATH = True
+
+# Snapshots are read and written this many rows at a time, so only one
+# chunk of raw CSV rows is alive next to the loaded records
+CSV_CHUNK_ROWS = 5000
+
+# The csv module rejects fields over 128 KiB by default, yet the snapshot
+# writer stores whatever was entered; raise the limit so long notes load
+csv.field_size_limit(2**31 - 1)
+
+# Integer columns; everything else is kept as text
+INT_FIELDS = {'id', 'claim_id', 'client_id', 'found_item_id'}
+
+# Rows skipped by the last iter_csv_records() pass over each table
+bad_rows = {}
+# Journal entries skipped as unreadable by the last replay
+bad_journal_entries = 0
+# Set when load_data() failed: the files on disk then hold data this process
+# never saw, so the session is read-only (see check_writable())
+load_failed = False
+
+_lock_depth = 0      # Nesting depth of data_lock() in this process
+_lock_handle = None  # Open DATA_LOCK_FILE while the lock is held
+_lock_guard = threading.RLock()  # Threads of this process queue here first
+
+def _lock_file(f):
+    """Block until this process holds the OS advisory lock on an open file"""
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass  # LK_LOCK gives up after 10 seconds; keep waiting
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+def _unlock_file(f):
+    """Release the lock taken by _lock_file()"""
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+@contextlib.contextmanager
+def data_lock():
+    """
+    Hold the advisory lock on DATA_LOCK_FILE (fcntl on POSIX, msvcrt on
+    Windows) while the data files are read or written. Re-entrant, so
+    locked helpers can call each other.
+    """
+    global _lock_depth, _lock_handle
+    
+    with _lock_guard:
+        if _lock_depth == 0:
+            handle = open(DATA_LOCK_FILE, 'a+b')
+            try:
+                _lock_file(handle)
+            except BaseException:
+                handle.close()
+                raise
+            _lock_handle = handle
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            if _lock_depth == 0:
+                _unlock_file(_lock_handle)
+                _lock_handle.close()
+                _lock_handle = None
+
+@contextlib.contextmanager
+def atomic_write(filename):
+    """
+    Open filename for writing text through a temporary file that replaces
+    it only once complete and flushed to disk, so a crash mid-write leaves
+    the previous version intact
+    """
+    temp = f"{filename}.tmp"
+    try:
+        with open(temp, 'w', newline='', encoding='utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, filename)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    
+    if os.name != 'nt':
+        # Make the rename itself durable
+        directory = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+def _file_version(filename):
+    """(inode, size, modification time) of a file, or None if it is missing"""
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _snapshot_version():
+    """Versions of every table's CSV snapshot"""
+    return tuple(_file_version(filename) for filename in TABLE_FILES.values())
+
+def _journal_size():
+    """Current size of the journal in bytes"""
+    return os.path.getsize(JOURNAL_FILE) if os.path.exists(JOURNAL_FILE) else 0
+
+def _chunked(rows, size):
+    """Yield lists of up to size items from any iterable"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _csv_rows(reader):
+    """Yield the rows of a csv reader, with None for each row it cannot parse"""
+    while True:
+        try:
+            yield next(reader)
+        except StopIteration:
+            return
+        except csv.Error:
+            yield None
+
+def _raw_csv_chunks(filename, chunk_rows):
+    """Yield chunks of raw rows (dicts, or None for unparsable rows) from a CSV snapshot"""
+    if CSV_FAST_PATH:
+        with open(filename, newline='', encoding='utf-8') as f:
+            yield from _chunked(_csv_rows(csv.DictReader(f, restval='')), chunk_rows)
+    else:
+        import pandas as pd
+        for df in pd.read_csv(filename, chunksize=chunk_rows, keep_default_na=False):
+            yield df.to_dict('records')
+
+def _convert_row(table, row):
+    """
+    Type-convert one raw CSV row into a record
+    Raises ValueError for a missing or non-integer primary key or a
+    non-integer value in another integer column.
+    """
+    key_field = TABLE_KEYS[table]
+    if row.get(key_field) in (None, ''):
+        raise ValueError(f"missing {key_field}")
+    for field in INT_FIELDS.intersection(row):
+        value = row[field]
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                continue
+        row[field] = int(value)
+    return RECORD_TYPES[table].from_dict(row)
+
+def iter_csv_records(table, filename, chunk_rows=None):
+    """
+    Stream a CSV snapshot as chunks of validated records
+    Rows are converted as they are read; unparsable or invalid rows and
+    repeated primary keys are skipped and counted in bad_rows[table].
+    """
+    key_field = TABLE_KEYS[table]
+    seen_keys = set()
+    bad_rows[table] = 0
+    
+    for raw_rows in _raw_csv_chunks(filename, chunk_rows or CSV_CHUNK_ROWS):
+        records = []
+        for row in raw_rows:
+            if row is None:
+                bad_rows[table] += 1
+                continue
+            try:
+                record = _convert_row(table, row)
+            except (TypeError, ValueError):
+                bad_rows[table] += 1
+                continue
+            if record[key_field] in seen_keys:
+                bad_rows[table] += 1
+                continue
+            seen_keys.add(record[key_field])
+            records.append(record)
+        yield records
+
+def _read_csv_snapshots():
+    """Read the CSV snapshot of every table; missing files give empty tables"""
+    tables = {}
+    for table, filename in TABLE_FILES.items():
+        rows = []
+        if os.path.exists(filename):
+            for records in iter_csv_records(table, filename):
+                rows.extend(records)
+        tables[table] = rows
+    return tables
+
+def _read_tables():
+    """Read every table from the storage backend; returns (tables, journal entries replayed, source)"""
+    global journal_offset, snapshot_version, db_version
+    
+    if STORAGE_BACKEND == 'sqlite':
+        with data_lock():
+            tables = db_load_tables()
+            db_version = _db_data_version()
+        return tables, 0, "SQLite database"
+    
+    with data_lock():
+        tables = _read_csv_snapshots()
+        # Re-apply mutations made since the last snapshot
+        replayed = replay_journal(tables)
+        snapshot_version = _snapshot_version()
+        journal_offset = _journal_size()
+    return tables, replayed, "CSV files"
+
+def _install_tables(tables):
+    """Make loaded tables the live data and continue the ID counters after them"""
     global lost_items, found_items, claims, clients
     global lost_id_counter, found_id_counter, claim_id_counter, client_id_counter
     
+    lost_items = tables['lost']
+    found_items = tables['found']
+    claims = tables['claims']
+    clients = tables['clients']
+    
+    if lost_items:
+        lost_id_counter = max([item['id'] for item in lost_items]) + 1
+    if found_items:
+        found_id_counter = max([item['id'] for item in found_items]) + 1
+    if claims:
+        claim_id_counter = max([claim['claim_id'] for claim in claims]) + 1
+    if clients:
+        client_id_counter = max([client['client_id'] for client in clients]) + 1
+
+def load_data():
+    """Load data from the configured storage backend"""
+    global load_failed, snapshot_version, db_version
+    
     try:
-        # Load lost items
-        if os.path.exists("lost_items.csv"):
-            df = pd.read_csv("lost_items.csv")
-            lost_items = df.to_dict('records')
-            if lost_items:
-                lost_id_counter = max([item['id'] for item in lost_items]) + 1
-        
-        # Load found items
-        if os.path.exists("found_items.csv"):
-            df = pd.read_csv("found_items.csv")
-            found_items = df.to_dict('records')
-            if found_items:
-                found_id_counter = max([item['id'] for item in found_items]) + 1
-        
-        # Load claims
-        if os.path.exists("claims.csv"):
-            df = pd.read_csv("claims.csv")
-            claims = df.to_dict('records')
-            if claims:
-                claim_id_counter = max([claim['claim_id'] for claim in claims]) + 1
-        
-        # Load clients
-        if os.path.exists("clients.csv"):
-            df = pd.read_csv("clients.csv")
-            clients = df.to_dict('records')
-            if clients:
-                client_id_counter = max([client['client_id'] for client in clients]) + 1
-                
-        print("✓ Data loaded successfully from CSV files!")
+        tables, replayed, source = _read_tables()
+        _install_tables(tables)
+        load_failed = False
+        
+        print(f"✓ Data loaded successfully from {source}!")
+        for table, skipped in bad_rows.items():
+            if skipped:
+                print(f"⚠ Skipped {skipped} invalid row(s) in {TABLE_FILES[table]}")
+        if replayed:
+            print(f"✓ Recovered {replayed} change(s) from the journal.")
+        if bad_journal_entries:
+            print(f"⚠ Skipped {bad_journal_entries} invalid entry(ies) in {JOURNAL_FILE}")
     except Exception as e:
-        print(f"⚠ Note: Could not load previous data. Starting fresh. ({e})")
+        load_failed = True
+        snapshot_version = db_version = None  # Nothing to merge with (see sync_from_disk())
+        print(f"✗ Could not load previous data: {e}")
+        print("⚠ This session is read-only: nothing can be reported, changed or saved")
+        print("  until the data files are repaired and the portal is restarted.")
+    
+    rebuild_indexes()
+    # Matching candidates are seeded on first use, not on the startup path
+    reset_match_table()
+
+def check_writable():
+    """
+    Raise RuntimeError if this session must not change the data
+    After a failed load the in-memory tables and ID counters know nothing
+    of what is on disk, so new records would reuse existing IDs.
+    """
+    if load_failed and not replaying_journal:
+        raise RuntimeError("previous data could not be loaded, so this session is read-only")
+
+def record_mutation(op, table, data):
+    """Persist one mutation with the configured storage backend"""
+    if replaying_journal:
+        return
+    if STORAGE_BACKEND == 'sqlite':
+        db_apply(op, table, data)
+    else:
+        journal_append(op, table, data)
+
+def journal_append(op, table, data):
+    """
+    Append one mutation to the journal and flush it to disk
+    op is 'insert' (data = full record) or 'update' (data = {'key', 'fields'})
+    """
+    global journal_entries, journal_offset
+    
+    entry = {'op': op, 'table': table, 'data': data}
+    line = json.dumps(entry, default=_json_default).encode('utf-8') + b"\n"
+    with data_lock():
+        if sync_from_disk():
+            # Changes by other processes come first in the journal, so
+            # this one goes back on top of them in memory as well
+            apply_journal_entry(entry)
+        with open(JOURNAL_FILE, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            journal_offset = f.tell()
+        journal_entries += 1
+        
+        if journal_entries >= JOURNAL_COMPACT_EVERY:
+            try:
+                compact_journal()
+            except Exception as e:
+                # The journal is still intact, so nothing is lost
+                print(f"⚠ Could not compact journal: {e}")
+
+def _checked_entry(entry):
+    """
+    (table, op, data) of a journal entry
+    Raises KeyError, TypeError or ValueError for an unknown table or op, a
+    missing key, or update fields outside the table's schema.
+    """
+    table = entry['table']
+    op = entry['op']
+    data = entry['data']
+    key_field = TABLE_KEYS[table]
+    if op == 'insert':
+        if key_field not in data:
+            raise KeyError(key_field)
+    elif op == 'update':
+        unknown = set(data['fields']) - RECORD_TYPES[table].FIELD_SET
+        if 'key' not in data or unknown:
+            raise KeyError(sorted(unknown) or 'key')
+    else:
+        raise ValueError(f"unknown op {op!r}")
+    return table, op, data
+
+def replay_journal(tables):
+    """
+    Apply journal entries to loaded tables (name -> rows); returns the number applied
+    Unreadable entries are skipped and counted in bad_journal_entries.
+    """
+    global journal_entries, bad_journal_entries
+    
+    journal_entries = 0
+    bad_journal_entries = 0
+    if not os.path.exists(JOURNAL_FILE):
+        return 0
+    
+    indexes = {}
+    good_end = 0
+    torn = False
+    with open(JOURNAL_FILE, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Torn last line from a crash mid-append
+                torn = True
+                break
+            good_end += len(line)
+            try:
+                table, op, data = _checked_entry(json.loads(line))
+            except (KeyError, TypeError, ValueError):
+                bad_journal_entries += 1
+                continue
+            
+            rows = tables[table]
+            key_field = TABLE_KEYS[table]
+            if table not in indexes:
+                indexes[table] = {row[key_field]: row for row in rows}
+            index = indexes[table]
+            
+            # Entries may already be in the snapshot if a compaction was
+            # interrupted, so inserts are skipped and updates are idempotent
+            if op == 'insert':
+                if data[key_field] not in index:
+                    record = RECORD_TYPES[table].from_dict(data)
+                    rows.append(record)
+                    index[data[key_field]] = record
+            else:
+                row = index.get(data['key'])
+                if row is not None:
+                    row.update(data['fields'])
+            
+            journal_entries += 1
+    
+    if torn:
+        # Cut the partial entry so the next append starts on a fresh line
+        with open(JOURNAL_FILE, 'r+b') as f:
+            f.truncate(good_end)
+    
+    return journal_entries
+
+def _find_record(table, key):
+    """In-memory record of a table by primary key, or None"""
+    if table == 'clients':
+        return next((client for client in clients if client['client_id'] == key), None)
+    return {'lost': lost_by_id, 'found': found_by_id, 'claims': claims_by_id}[table].get(key)
+
+def apply_journal_entry(entry):
+    """
+    Apply one journal entry (typically written by another process) to the
+    in-memory tables and indexes, without journaling it again. Inserts of
+    records already present are skipped and updates are idempotent.
+    """
+    global replaying_journal
+    global lost_id_counter, found_id_counter, claim_id_counter, client_id_counter
+    
+    table = entry['table']
+    data = entry['data']
+    replaying_journal = True
+    try:
+        if entry['op'] == 'insert':
+            record = as_record(table, data)
+            key = record[TABLE_KEYS[table]]
+            if _find_record(table, key) is not None:
+                return
+            if table == 'lost':
+                add_lost_item(record)
+                lost_id_counter = max(lost_id_counter, key + 1)
+            elif table == 'found':
+                add_found_item(record)
+                found_id_counter = max(found_id_counter, key + 1)
+            elif table == 'claims':
+                add_claim(record)
+                claim_id_counter = max(claim_id_counter, key + 1)
+            else:
+                add_client(record)
+                client_id_counter = max(client_id_counter, key + 1)
+        elif entry['op'] == 'update':
+            row = _find_record(table, data['key'])
+            if row is None:
+                return
+            fields = dict(data['fields'])
+            status = fields.pop('status', None)
+            if status is not None:
+                # Status changes go through the helpers that keep indexes current
+                if table == 'lost':
+                    set_lost_status(row, status)
+                elif table == 'found':
+                    set_found_status(row, status)
+                else:
+                    set_claim_status(row, status, fields.pop('admin_notes', None))
+            row.update(fields)
+    finally:
+        replaying_journal = False
+
+def _reload_tables():
+    """Re-read every table from the storage backend, replacing the in-memory data"""
+    tables, _, _ = _read_tables()
+    _install_tables(tables)
+    rebuild_indexes()
+    reset_match_table()
+
+def sync_from_disk():
+    """
+    Check-and-merge step, run under data_lock() before the data files are
+    written. If another process appended to the journal since this one last
+    read or wrote it, the new entries are applied in memory; if the
+    snapshots were rewritten (they then hold every journaled change,
+    this process's included) all tables are reloaded. On the SQLite
+    backend the tables are reloaded whenever another connection committed
+    since the last load. Returns True if anything changed.
+    """
+    global journal_offset, journal_entries, bad_journal_entries
+    
+    if STORAGE_BACKEND == 'sqlite':
+        if db_version is None or _db_data_version() == db_version:
+            return False
+        _reload_tables()
+        return True
+    if snapshot_version is None:
+        # Nothing loaded from the CSV files yet, so nothing to merge with
+        return False
+    
+    size = _journal_size()
+    if _snapshot_version() != snapshot_version or size < journal_offset:
+        _reload_tables()
+        return True
+    if size == journal_offset:
+        return False
+    
+    torn = False
+    with open(JOURNAL_FILE, 'rb') as f:
+        f.seek(journal_offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partial entry of a writer that crashed mid-append
+                torn = True
+                break
+            journal_offset += len(line)
+            try:
+                entry = json.loads(line)
+                _checked_entry(entry)
+            except (KeyError, TypeError, ValueError):
+                bad_journal_entries += 1
+                continue
+            apply_journal_entry(entry)
+            journal_entries += 1
+    
+    if torn:
+        with open(JOURNAL_FILE, 'r+b') as f:
+            f.truncate(journal_offset)
+    return True
+
+def refresh_data():
+    """Pick up what other sessions saved, before a screen shows the data"""
+    if portal_server is not None:
+        return  # Kiosk mode: the server holds the data
+    with data_lock():
+        sync_from_disk()
+
+def _csv_value(value):
+    """Format a record value for a CSV cell (missing values become empty)"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return value
+
+def _write_snapshots():
+    """Rewrite the CSV snapshot of every non-empty table, a chunk of rows at a time"""
+    for table, filename in TABLE_FILES.items():
+        rows = _table_rows(table)
+        if not rows:
+            continue
+        
+        fieldnames = list(TABLE_FIELDS[table])
+        with atomic_write(filename) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for chunk in _chunked(rows, CSV_CHUNK_ROWS):
+                writer.writerows([_csv_value(row.get(field)) for field in fieldnames]
+                                 for row in chunk)
+
+def compact_journal():
+    """Fold the journal into fresh CSV snapshots and start an empty journal"""
+    global journal_entries, journal_offset, snapshot_version
+    
+    check_writable()
+    with data_lock():
+        # A crash before the journal is emptied is harmless: replaying
+        # entries already in the snapshots changes nothing
+        _write_snapshots()
+        open(JOURNAL_FILE, 'w').close()
+        journal_entries = 0
+        journal_offset = 0
+        snapshot_version = _snapshot_version()
 
 def save_data():
     """Save all data to CSV files"""
+    if load_failed:
+        print("⚠ Nothing saved: previous data could not be loaded, so this session is read-only.")
+        return False
     try:
-        # Save lost items
-        if lost_items:
-            df_lost = pd.DataFrame(lost_items)
-            df_lost.to_csv("lost_items.csv", index=False)
-        
-        # Save found items
-        if found_items:
-            df_found = pd.DataFrame(found_items)
-            df_found.to_csv("found_items.csv", index=False)
-        
-        # Save claims
-        if claims:
-            df_claims = pd.DataFrame(claims)
-            df_claims.to_csv("claims.csv", index=False)
-        
-        # Save clients
-        if clients:
-            df_clients = pd.DataFrame(clients)
-            df_clients.to_csv("clients.csv", index=False)
+        if STORAGE_BACKEND == 'sqlite':
+            # Every mutation is already committed; just flush the connection
+            db_connect().commit()
+            save_match_table()
+            print("✓ All data saved successfully to SQLite database!")
+            return True
         
+        with data_lock():
+            merged = sync_from_disk()
+            compact_journal()
+            save_match_table()
+        if merged:
+            print("✓ Merged changes saved meanwhile by other sessions.")
         print("✓ All data saved successfully to CSV files!")
         return True
     except Exception as e:
@@ -201,7 +946,512 @@ def save_data():
         return False
 
 
+# ==================== SQLITE STORAGE ====================
+
+DB_FILE = "lost_found.db"
+DB_TABLES = {'lost': 'lost_items', 'found': 'found_items', 'claims': 'claims', 'clients': 'clients'}
+
+# Secondary indexes: (table, column, case-insensitive)
+DB_INDEXES = [
+    ('lost', 'status', True), ('lost', 'category', True), ('lost', 'color', True),
+    ('lost', 'reporter_username', True), ('lost', 'date_lost', False),
+    ('found', 'status', True), ('found', 'category', True), ('found', 'color', True),
+    ('found', 'finder_username', True), ('found', 'date_found', False),
+    ('claims', 'status', True), ('claims', 'claimant_username', True),
+    ('claims', 'found_item_id', False), ('claims', 'claim_date', False),
+    ('clients', 'username', True), ('clients', 'registration_date', False)
+]
+
+db_conn = None
+
+def db_connect():
+    """Open the SQLite database once, creating tables and indexes if needed"""
+    global db_conn
+    
+    if db_conn is None:
+        db_conn = sqlite3.connect(DB_FILE)
+        db_conn.row_factory = sqlite3.Row
+        for table, fields in TABLE_FIELDS.items():
+            columns = []
+            for field in fields:
+                if field == TABLE_KEYS[table]:
+                    columns.append(f"{field} INTEGER PRIMARY KEY")
+                elif field == 'found_item_id':
+                    columns.append(f"{field} INTEGER")
+                else:
+                    columns.append(f"{field} TEXT")
+            db_conn.execute(f"CREATE TABLE IF NOT EXISTS {DB_TABLES[table]} ({', '.join(columns)})")
+        for table, column, nocase in DB_INDEXES:
+            collate = " COLLATE NOCASE" if nocase else ""
+            db_conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{DB_TABLES[table]}_{column} "
+                            f"ON {DB_TABLES[table]} ({column}{collate})")
+        db_conn.commit()
+    return db_conn
+
+def _db_value(value):
+    """Convert a record value into something sqlite3 can bind"""
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, float):
+        return None if value != value else value  # NaN from pandas means empty
+    if hasattr(value, 'item'):
+        return _db_value(value.item())
+    return str(value)
+
+def _db_data_version():
+    """SQLite's data_version: changes whenever another connection commits"""
+    return db_connect().execute("PRAGMA data_version").fetchone()[0]
+
+def _db_insert(conn, table, record):
+    """Insert a record; raises sqlite3.IntegrityError if its primary key is taken"""
+    fields = TABLE_FIELDS[table]
+    placeholders = ', '.join('?' * len(fields))
+    conn.execute(f"INSERT INTO {DB_TABLES[table]} ({', '.join(fields)}) "
+                 f"VALUES ({placeholders})",
+                 [_db_value(record.get(field)) for field in fields])
+
+def db_apply(op, table, data):
+    """
+    Write one mutation through to the database
+    Like journal_append(), it first picks up what other processes committed,
+    so IDs handed out from the refreshed counters are unused; a key that is
+    taken anyway raises sqlite3.IntegrityError instead of being dropped.
+    """
+    conn = db_connect()
+    with data_lock():
+        if sync_from_disk():
+            # The tables were reloaded without this change; apply it again
+            apply_journal_entry({'op': op, 'table': table, 'data': data})
+        if op == 'insert':
+            _db_insert(conn, table, data)
+        elif op == 'update':
+            fields = [field for field in data['fields'] if field in TABLE_FIELDS[table]]
+            assignments = ', '.join(f"{field} = ?" for field in fields)
+            conn.execute(f"UPDATE {DB_TABLES[table]} SET {assignments} "
+                         f"WHERE {TABLE_KEYS[table]} = ?",
+                         [_db_value(data['fields'][field]) for field in fields] + [data['key']])
+        conn.commit()
+
+def _db_rows(cursor):
+    """Yield query rows as plain records (NULL becomes empty text)"""
+    return ({key: ('' if row[key] is None else row[key]) for key in row.keys()}
+            for row in cursor)
+
+def migrate_csv_to_sqlite():
+    """
+    Copy the CSV snapshots, with any pending journal entries applied,
+    into the SQLite database. Returns the number of rows copied.
+    """
+    tables = _read_csv_snapshots()
+    replay_journal(tables)
+    
+    conn = db_connect()
+    copied = 0
+    for table, rows in tables.items():
+        for row in rows:
+            _db_insert(conn, table, row)
+        copied += len(rows)
+    conn.commit()
+    return copied
+
+def db_load_tables():
+    """Load every table from SQLite, migrating existing CSV data on first use"""
+    conn = db_connect()
+    empty = all(
+        conn.execute(f"SELECT 1 FROM {DB_TABLES[table]} LIMIT 1").fetchone() is None
+        for table in TABLE_FIELDS
+    )
+    if empty and any(os.path.exists(filename) for filename in TABLE_FILES.values()):
+        copied = migrate_csv_to_sqlite()
+        print(f"✓ Migrated {copied} record(s) from CSV files to {DB_FILE}.")
+    
+    return {
+        table: [RECORD_TYPES[table].from_dict(row) for row in _db_rows(conn.execute(
+            f"SELECT * FROM {DB_TABLES[table]} ORDER BY {TABLE_KEYS[table]}"))]
+        for table in TABLE_FIELDS
+    }
+
+def iter_items(table, **filters):
+    """
+    Read-only lookup of records whose fields equal the given values
+    (case-insensitive), yielded lazily in ID order. Uses indexed SQL on
+    the SQLite backend and a scan of the in-memory table otherwise.
+    """
+    if STORAGE_BACKEND == 'sqlite':
+        where = ' AND '.join(f"{field} = ? COLLATE NOCASE" for field in filters)
+        sql = f"SELECT * FROM {DB_TABLES[table]}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {TABLE_KEYS[table]}"
+        return _db_rows(db_connect().execute(sql, list(filters.values())))
+    
+    wanted = {field: value.lower() for field, value in filters.items()}
+    if table in ('lost', 'found') and 'status' in wanted:
+        # Only walk the items that already have the requested status
+        rows = items_with_status(table, wanted.pop('status')).values()
+    else:
+        rows = _table_rows(table)
+    return (row for row in rows
+            if all(_norm_text(row.get(field)) == value for field, value in wanted.items()))
+
+# ==================== INDEXES ====================
+
+def _username_key(username):
+    """Case-folded form of a username, used as the index key"""
+    return str(username).casefold()
+
+def rebuild_indexes():
+    """Rebuild every derived index from the in-memory tables"""
+    for index, rows, key_field in ((lost_by_id, lost_items, 'id'),
+                                   (found_by_id, found_items, 'id'),
+                                   (claims_by_id, claims, 'claim_id')):
+        index.clear()
+        index.update((row[key_field], row) for row in rows)
+    
+    clients_by_username.clear()
+    for client in clients:
+        clients_by_username[_username_key(client['username'])] = client
+    
+    lost_by_status.clear()
+    for item in lost_items:
+        _add_to_status_index(lost_by_status, item)
+    found_by_status.clear()
+    for item in found_items:
+        _add_to_status_index(found_by_status, item)
+    
+    for table, index in records_by_user.items():
+        index.clear()
+        for record in _table_rows(table):
+            _add_to_user_index(table, record)
+    
+    reset_trigram_index()
+    rebuild_analytics()
+
+def _status_index(table):
+    """Status index of the lost or found table"""
+    return lost_by_status if table == 'lost' else found_by_status
+
+def _add_to_status_index(index, item):
+    """File an item under its current status"""
+    index.setdefault(_norm_text(item['status']), {})[item['id']] = item
+
+def _move_status(index, item, old_status):
+    """Re-file an item whose status changed from old_status"""
+    bucket = index.get(_norm_text(old_status))
+    if bucket is not None:
+        bucket.pop(item['id'], None)
+        if not bucket:
+            del index[_norm_text(old_status)]
+    _add_to_status_index(index, item)
+
+# Username field that ties a record to the client who created it
+USER_FIELDS = {'lost': 'reporter_username', 'found': 'finder_username', 'claims': 'claimant_username'}
+
+def _add_to_user_index(table, record):
+    """File a record under the client who reported or claimed it"""
+    username = _username_key(record.get(USER_FIELDS[table]) or '')
+    records_by_user[table].setdefault(username, {})[record[TABLE_KEYS[table]]] = record
+
+def records_of_user(table, username):
+    """Lost items, found items or claims created by a client, in ID order of creation"""
+    return list(records_by_user[table].get(_username_key(username), {}).values())
+
+def items_with_status(table, status):
+    """Items of the lost or found table with the given status, as {id: item}"""
+    return _status_index(table).get(status.lower(), {})
+
+def active_items(table):
+    """Open lost items or unclaimed found items, in ID order"""
+    retired = 'closed' if table == 'lost' else 'claimed'
+    buckets = [bucket for status, bucket in _status_index(table).items() if status != retired]
+    if len(buckets) == 1:
+        return list(buckets[0].values())
+    return sorted((item for bucket in buckets for item in bucket.values()),
+                  key=lambda item: item['id'])
+
+def find_client(username):
+    """Return the client with this username (case-insensitive), or None"""
+    return clients_by_username.get(_username_key(username))
+
+# ==================== ANALYTICS COUNTERS ====================
+
+# Field counted for each table and dimension. Item statuses are counted
+# lower-cased, like the status index; everything else as stored.
+ANALYTICS_DIMENSIONS = {
+    'lost': {'category': 'category', 'status': 'status', 'location': 'location', 'day': 'date_lost'},
+    'found': {'category': 'category', 'status': 'status', 'location': 'location', 'day': 'date_found'},
+    'claims': {'status': 'status', 'day': 'claim_date'}
+}
+
+# Empty until load_data() counts the tables (through rebuild_indexes)
+analytics.update({table: {dimension: collections.Counter() for dimension in dimensions}
+                  for table, dimensions in ANALYTICS_DIMENSIONS.items()})
+
+def _analytics_value(table, dimension, record):
+    """Value a record is counted under for one dimension"""
+    value = record.get(ANALYTICS_DIMENSIONS[table][dimension])
+    if dimension == 'status' and table != 'claims':
+        return _norm_text(value)
+    return value
+
+def _count(counter, value, delta):
+    """Add delta to a counter entry, dropping entries that fall to zero"""
+    counter[value] += delta
+    if counter[value] <= 0:
+        del counter[value]
+
+def _count_record(table, record, delta=1):
+    """Count a record in (delta=1) or out of (delta=-1) every dimension of its table"""
+    for dimension, counter in analytics[table].items():
+        _count(counter, _analytics_value(table, dimension, record), delta)
+
+def _count_status_change(table, record, old_status):
+    """Move a record from old_status to its current status in the status counter"""
+    counter = analytics[table]['status']
+    if table != 'claims':
+        old_status = _norm_text(old_status)
+    _count(counter, old_status, -1)
+    _count(counter, _analytics_value(table, 'status', record), 1)
+
+def build_analytics():
+    """Count every table from scratch; returns table -> dimension -> Counter"""
+    fresh = {}
+    for table, dimensions in ANALYTICS_DIMENSIONS.items():
+        rows = _table_rows(table)
+        fresh[table] = {
+            dimension: collections.Counter(_analytics_value(table, dimension, row) for row in rows)
+            for dimension in dimensions
+        }
+    return fresh
+
+def rebuild_analytics():
+    """Replace the live counters with a full recount"""
+    analytics.clear()
+    analytics.update(build_analytics())
+
+def verify_analytics():
+    """
+    Recount every table and compare with the live counters
+    Returns the (table, dimension) pairs that disagreed; the live counters
+    are replaced by the recount either way.
+    """
+    fresh = build_analytics()
+    mismatched = [(table, dimension)
+                  for table, dimensions in fresh.items()
+                  for dimension, counter in dimensions.items()
+                  if counter != analytics.get(table, {}).get(dimension)]
+    analytics.clear()
+    analytics.update(fresh)
+    return mismatched
+
+def counts(table, dimension):
+    """Live (value, count) pairs for one table and dimension, most common first"""
+    return analytics[table][dimension].most_common()
+
+def status_count(table, status):
+    """Number of records in a table with the given status"""
+    if table != 'claims':
+        status = _norm_text(status)
+    return analytics[table]['status'][status]
+
+# ==================== TEXT SEARCH INDEX ====================
+
+def _trigrams(text):
+    """Set of 3-character substrings of a (lower-cased) text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
+def _index_trigrams(table, item):
+    """Add an item's name and description to the trigram index"""
+    for field, postings in trigram_index[table].items():
+        for gram in _trigrams(_norm_text(item.get(field))):
+            postings.setdefault(gram, set()).add(item['id'])
+
+def reset_trigram_index():
+    """Drop the trigram index; it is rebuilt by the next search"""
+    global trigram_ready
+    
+    for fields in trigram_index.values():
+        for postings in fields.values():
+            postings.clear()
+    trigram_ready = False
+
+def build_trigram_index():
+    """Index the name and description of every lost and found item"""
+    global trigram_ready
+    
+    reset_trigram_index()
+    for item in lost_items:
+        _index_trigrams('lost', item)
+    for item in found_items:
+        _index_trigrams('found', item)
+    trigram_ready = True
+
+def search_text(table, field, keyword, status):
+    """
+    Items of the lost/found table with the given status whose field
+    contains keyword (case-insensitive substring), yielded in ID order.
+    Posting lists of the keyword's trigrams are intersected and only the
+    surviving candidates are checked against the real text.
+    """
+    if not trigram_ready:
+        build_trigram_index()
+    
+    keyword = keyword.lower()
+    pool = items_with_status(table, status)
+    grams = _trigrams(keyword)
+    
+    if grams:
+        postings = trigram_index[table][field]
+        lists = sorted((postings.get(gram, set()) for gram in grams), key=len)
+        candidate_ids = set.intersection(*lists)
+        candidates = (pool[item_id] for item_id in sorted(candidate_ids) if item_id in pool)
+    else:
+        # Keywords shorter than 3 characters have no trigrams to look up
+        candidates = pool.values()
+    
+    return (item for item in candidates if keyword in _norm_text(item.get(field)))
+
+# ==================== DATA MUTATIONS ====================
+
+# Every change to the data goes through these helpers so that the storage
+# backend and the derived indexes stay in step with the in-memory lists.
+# Each one calls check_writable() before touching anything.
+
+def add_lost_item(item):
+    """Insert a lost item report; returns the number of new match candidates"""
+    check_writable()
+    item = as_record('lost', item)
+    lost_items.append(item)
+    lost_by_id[item['id']] = item
+    _add_to_status_index(lost_by_status, item)
+    _count_record('lost', item)
+    _add_to_user_index('lost', item)
+    if trigram_ready:
+        _index_trigrams('lost', item)
+    record_mutation('insert', 'lost', item)
+    return match_new_item('lost', item)
+
+def add_found_item(item):
+    """Insert a found item report; returns the number of new match candidates"""
+    check_writable()
+    item = as_record('found', item)
+    found_items.append(item)
+    found_by_id[item['id']] = item
+    _add_to_status_index(found_by_status, item)
+    _count_record('found', item)
+    _add_to_user_index('found', item)
+    if trigram_ready:
+        _index_trigrams('found', item)
+    record_mutation('insert', 'found', item)
+    return match_new_item('found', item)
+
+def create_item(kind, item_details, location, date_value, person):
+    """
+    Record a newly reported lost or found item under the next ID
+    person supplies the reporter/finder username, name and contact.
+    Returns (item, number of new match candidates).
+    """
+    global lost_id_counter, found_id_counter
+    
+    with data_lock():
+        # Pick up reports saved by other sessions first, so the ID is unused
+        sync_from_disk()
+        if kind == 'lost':
+            item = LostItem(
+                id=lost_id_counter,
+                location=location,
+                date_lost=date_value,
+                status='open',
+                reporter_username=person['username'],
+                reporter_name=person['name'],
+                reporter_contact=person['contact'],
+                **item_details
+            )
+            new_matches = add_lost_item(item)
+            lost_id_counter += 1
+        else:
+            item = FoundItem(
+                id=found_id_counter,
+                location=location,
+                date_found=date_value,
+                status='available',
+                finder_username=person['username'],
+                finder_name=person['name'],
+                finder_contact=person['contact'],
+                **item_details
+            )
+            new_matches = add_found_item(item)
+            found_id_counter += 1
+    return item, new_matches
+
+def add_claim(claim):
+    """Insert a claim request"""
+    check_writable()
+    claim = as_record('claims', claim)
+    claims.append(claim)
+    claims_by_id[claim['claim_id']] = claim
+    _count_record('claims', claim)
+    _add_to_user_index('claims', claim)
+    record_mutation('insert', 'claims', claim)
+
+def add_client(client):
+    """Insert a registered client"""
+    check_writable()
+    client = as_record('clients', client)
+    clients.append(client)
+    clients_by_username[_username_key(client['username'])] = client
+    record_mutation('insert', 'clients', client)
+
+def set_lost_status(item, status):
+    """Change a lost item's status, retiring its match candidates once closed"""
+    check_writable()
+    old_status = item['status']
+    item['status'] = status
+    _move_status(lost_by_status, item, old_status)
+    _count_status_change('lost', item, old_status)
+    record_mutation('update', 'lost', {'key': item['id'], 'fields': {'status': status}})
+    if not _is_active('lost', item):
+        retire_matches('lost', item['id'])
+
+def set_found_status(item, status):
+    """Change a found item's status, retiring its match candidates once claimed"""
+    check_writable()
+    old_status = item['status']
+    item['status'] = status
+    _move_status(found_by_status, item, old_status)
+    _count_status_change('found', item, old_status)
+    record_mutation('update', 'found', {'key': item['id'], 'fields': {'status': status}})
+    if not _is_active('found', item):
+        retire_matches('found', item['id'])
+
+CLAIM_STATUSES = {
+    '1': 'Claim Verified',
+    '2': 'Not Verified',
+    '3': 'Collect From SWF Office',
+    '4': 'Claimed',
+    '5': 'Claim Rejected'
+}
+
+def apply_claim_status(claim, status, admin_notes=None):
+    """Move a claim to a new status; a collected claim marks its found item claimed"""
+    set_claim_status(claim, status, admin_notes)
+    
+    # Update found item status if claimed
+    if status == 'Claimed':
+        item = found_by_id.get(claim['found_item_id'])
+        if item is not None:
+            set_found_status(item, 'claimed')
+
+def set_claim_status(claim, status, admin_notes=None):
+    """Change a claim's status, optionally recording admin notes"""
+    check_writable()
+    fields = {'status': status}
+    if admin_notes is not None:
+        fields['admin_notes'] = admin_notes
+    old_status = claim['status']
+    claim.update(fields)
+    _count_status_change('claims', claim, old_status)
+    record_mutation('update', 'claims', {'key': claim['claim_id'], 'fields': fields})
 
     
 # The lines of code below are drafted by Tanmay Khare
@@ -213,16 +1463,18 @@ def client_register():
     
     print_header("CLIENT REGISTRATION")
     
+    if not require_writable():
+        return False
+    
     print("Create your account to access the Lost & Found Portal\n")
     
     username = input("Choose Username: ").strip()
     
     # Check if username already exists
-    for client in clients:
-        if client['username'].lower() == username.lower():
-            print("\n✗ Username already exists! Please choose a different one.")
-            pause()
-            return False
+    if find_client(username) is not None:
+        print("\n✗ Username already exists! Please choose a different one.")
+        pause()
+        return False
     
     password = input("Choose Password: ").strip()
     confirm_password = input("Confirm Password: ").strip()
@@ -237,112 +1489,965 @@ def client_register():
         pause()
         return False
     
-    name = input("Full Name: ").strip()
-    contact = input("Contact Number: ").strip()
-    email = input("Email Address: ").strip()
+    name = input("Full Name: ").strip()
+    contact = input("Contact Number: ").strip()
+    email = input("Email Address: ").strip()
+    
+    if portal_server is not None:
+        try:
+            portal_server.call('register', username=username, password=password,
+                               name=name, contact=contact, email=email)
+        except ServerError as e:
+            print(f"\n✗ {e}!")
+            pause()
+            return False
+    else:
+        with data_lock():
+            # Pick up registrations saved by other sessions first
+            sync_from_disk()
+            taken = find_client(username) is not None
+            if not taken:
+                # Create new client record
+                new_client = Client(
+                    client_id=client_id_counter,
+                    username=username,
+                    password_hash=hash_password(password),
+                    name=name,
+                    contact=contact,
+                    email=email,
+                    registration_date=get_current_date()
+                )
+                
+                add_client(new_client)
+                client_id_counter += 1
+        
+        # Prompts wait for the user, so they run only once the lock is released
+        if taken:
+            print("\n✗ Username was just taken! Please choose a different one.")
+            pause()
+            return False
+    
+    print(f"\n✓ Registration successful! Welcome, {name}!")
+    print("You can now login with your credentials.")
+    pause()
+    return True
+
+def client_login():
+    """Client login verification"""
+    global current_client
+    
+    refresh_data()
+    
+    print_header("CLIENT LOGIN")
+    
+    if portal_server is None and not clients:
+        print("⚠ No registered clients found.")
+        print("Please register first to access the portal.\n")
+        pause()
+        return False
+    
+    attempts = 3
+    while attempts > 0:
+        username = input("Username: ").strip()
+        password = input("Password: ").strip()
+        
+        client = check_client_login(username, password)
+        if client is not None:
+            current_client = client
+            print(f"\n✓ Login successful! Welcome back, {client['name']}!")
+            pause()
+            return True
+        
+        attempts -= 1
+        if attempts > 0:
+            print(f"\n✗ Invalid credentials! {attempts} attempt(s) remaining.\n")
+        else:
+            print("\n✗ Too many failed attempts. Returning to main menu.")
+            pause()
+            return False
+    
+    return False
+
+def client_logout():
+    """Logout current client"""
+    global current_client
+    current_client = None
+    print("\n✓ Logged out successfully!")
+    pause()
+
+def check_client_login(username, password):
+    """Client record for valid credentials, or None (the server checks them in kiosk mode)"""
+    if portal_server is not None:
+        try:
+            return portal_server.call('login', username=username, password=password)
+        except ServerError:
+            return None
+    client = find_client(username)
+    if client is not None and verify_password(password, client['password_hash']):
+        return client
+    return None
+
+def require_client_login():
+    """Check if client is logged in"""
+    if current_client is None:
+        print("\n⚠ You must be logged in to access this feature!")
+        pause()
+        return False
+    return True
+
+def require_writable():
+    """Check that this session may change the data (see check_writable())"""
+    if load_failed:
+        print("\n⚠ This session is read-only: previous data could not be loaded.")
+        print("Repair the data files and restart the portal to make changes.")
+        pause()
+        return False
+    return True
+
+
+
+# The lines of code below are drafted by Samarth Agrawal
+# ==================== ADMIN LOGIN ====================
+
+def admin_login():
+    """Admin login verification"""
+    print_header("ADMIN LOGIN")
+    
+    attempts = 3
+    while attempts > 0:
+        username = input("Username: ").strip()
+        password = input("Password: ").strip()
+        
+        if username in admins and admins[username] == password:
+            print(f"\n✓ Login successful! Welcome, {username}!")
+            pause()
+            return True
+        else:
+            attempts -= 1
+            if attempts > 0:
+                print(f"\n✗ Invalid credentials! {attempts} attempt(s) remaining.\n")
+            else:
+                print("\n✗ Too many failed attempts. Returning to main menu.")
+                pause()
+                return False
+    
+    return False
+
+# ==================== FUZZY NAME SIMILARITY ====================
+# Item names are reduced to letters and digits ("iPhone 13" -> "iphone13",
+# "back-pack" -> "backpack"), cut into character shingles and summarized by
+# a MinHash signature. Signatures are split into LSH bands; two names are
+# only compared when they share a band, so similar names are found through
+# bucket lookups instead of comparing every pair.
+
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16  # 16 bands x 4 rows: ~64% recall at similarity 0.5, ~99% at 0.7
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+FUZZY_WEIGHT = 30            # Points for identical shingle sets, scaled by similarity
+FUZZY_MIN_SIMILARITY = 0.5   # Less similar names earn nothing
+
+# Free-text fields compared the same way ("SN-4471" / "sn 4471"): field ->
+# (reason, points for identical text, minimum similarity). A matching serial
+# number is enough for a match on its own, but IDs one digit apart belong to
+# different items, so they must be nearly identical; notes only add to the
+# other evidence.
+DETAIL_FIELDS = {
+    'batch_id': ("Similar batch/ID", 40, 0.8),
+    'additional_notes': ("Similar notes", 15, FUZZY_MIN_SIMILARITY)
+}
+
+# Fixed hash family (a * h + b) mod p, so signatures are stable across runs and processes
+_MINHASH_PRIME = (1 << 61) - 1
+_rng = random.Random(1305)
+_MINHASH_COEFFS = [(_rng.randrange(1, _MINHASH_PRIME), _rng.randrange(_MINHASH_PRIME))
+                   for _ in range(MINHASH_PERMUTATIONS)]
+del _rng
+
+def _shingles(name):
+    """Character shingles of a lower-cased name with everything but letters and digits removed"""
+    text = ''.join(ch for ch in name if ch.isalnum())
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+@functools.lru_cache(maxsize=65536)
+def name_signature(name):
+    """
+    (MinHash signature, LSH band keys) of a lower-cased name
+    Names without letters or digits get (None, ()) and never collide.
+    Cached, so every item with the same name shares one signature.
+    """
+    hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in _shingles(name)]
+    if not hashes:
+        return None, ()
+    signature = tuple(min((a * h + b) % _MINHASH_PRIME for h in hashes)
+                      for a, b in _MINHASH_COEFFS)
+    bands = tuple(('lsh', band) + signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+                  for band in range(LSH_BANDS))
+    return signature, bands
+
+@functools.lru_cache(maxsize=262144)
+def fuzzy_similarity(name_a, name_b):
+    """Estimated shingle similarity of two lower-cased names; 0.0 unless they share an LSH band"""
+    signature_a, bands_a = name_signature(name_a)
+    signature_b, bands_b = name_signature(name_b)
+    if not any(a == b for a, b in zip(bands_a, bands_b)):
+        return 0.0
+    return sum(a == b for a, b in zip(signature_a, signature_b)) / MINHASH_PERMUTATIONS
+
+def fuzzy_points(name_a, name_b, weight=FUZZY_WEIGHT, min_similarity=FUZZY_MIN_SIMILARITY):
+    """Fuzzy score (up to weight) of two lower-cased texts and the similarity behind it"""
+    similarity = fuzzy_similarity(name_a, name_b)
+    if similarity < min_similarity:
+        return 0, similarity
+    return round(weight * similarity), similarity
+
+# ==================== SMART MATCHING ====================
+
+MATCH_THRESHOLD = 40  # Minimum score for a pair to be reported as a match
+DATE_WINDOW_DAYS = 7  # Lost/found dates this close earn the date bonus
+
+def _norm_text(value):
+    """Lower-case a text field, treating missing values as empty"""
+    return value.lower() if isinstance(value, str) else ''
+
+def _detail_text(value):
+    """Lower-cased batch/ID or notes text; the questionnaire's "N/A" placeholder becomes empty"""
+    text = _norm_text(value).strip()
+    return '' if text == 'n/a' else text
+
+def _match_key(item, date_field):
+    """Pre-compute the normalized fields used when scoring an item"""
+    name = _norm_text(item.get('item_name'))
+    key = {
+        'name': name,
+        'keywords': set(name.split()),
+        'lsh': name_signature(name)[1],
+        'category': _norm_text(item.get('category')),
+        'color': _norm_text(item.get('color')),
+        'location': _norm_text(item.get('location')),
+        'date': item.date_ord if isinstance(item, Record) else date_ordinal(item.get(date_field))
+    }
+    for field in DETAIL_FIELDS:
+        key[field] = _detail_text(item.get(field))
+    return key
+
+def score_pair(lost_key, found_key):
+    """
+    Score a lost/found pair from their match keys
+    Returns (score, reasons) using the smart matching rules
+    """
+    score = 0
+    reasons = []
+    
+    # Check item name similarity
+    common_keywords = lost_key['keywords'].intersection(found_key['keywords'])
+    if common_keywords:
+        score += len(common_keywords) * 30
+        reasons.append(f"Common keywords: {', '.join(sorted(common_keywords))}")
+    else:
+        # Spelling variants ("iphone13" / "iPhone 13") share no exact keyword
+        points, similarity = fuzzy_points(lost_key['name'], found_key['name'])
+        if points:
+            score += points
+            reasons.append(f"Similar name ({similarity:.0%})")
+    
+    # Check serial number and notes
+    for field, (reason, weight, min_similarity) in DETAIL_FIELDS.items():
+        points, similarity = fuzzy_points(lost_key[field], found_key[field], weight, min_similarity)
+        if points:
+            score += points
+            reasons.append(f"{reason} ({similarity:.0%})")
+    
+    # Check category
+    if lost_key['category'] == found_key['category']:
+        score += 25
+        reasons.append("Same category")
+    
+    # Check color
+    if lost_key['color'] == found_key['color']:
+        score += 20
+        reasons.append("Same color")
+    
+    # Check location similarity
+    if lost_key['location'] == found_key['location']:
+        score += 15
+        reasons.append("Same location")
+    
+    # Check date proximity (within 7 days), using pre-parsed day ordinals
+    if lost_key['date'] is not None and found_key['date'] is not None:
+        date_diff = abs(found_key['date'] - lost_key['date'])
+        
+        if date_diff <= DATE_WINDOW_DAYS:
+            score += 15
+            reasons.append(f"Found within {date_diff} days")
+    
+    return score, reasons
+
+def _block_keys(key):
+    """Blocking keys of an item: item-name tokens, LSH bands, color, and category + location"""
+    keys = [('color', key['color']), ('category_location', key['category'], key['location'])]
+    keys.extend(('keyword', word) for word in key['keywords'])
+    keys.extend(key['lsh'])
+    for field in DETAIL_FIELDS:
+        keys.extend((field,) + band for band in name_signature(key[field])[1])
+    return keys
+
+def build_match_blocks(found_keys):
+    """
+    Candidate-blocking index: blocking key -> set of found item positions
+    A pair only reaches the threshold if it shares a keyword, an LSH band
+    of the name, batch/ID or notes (needed for their fuzzy points), the
+    color, or the category together
+    with the location or a date inside the window; anything else scores at
+    most 35. All but the last are blocks, the last is answered by a window
+    join over dates (see date_window).
+    """
+    blocks = {}
+    for pos, key in enumerate(found_keys):
+        for block_key in _block_keys(key):
+            blocks.setdefault(block_key, set()).add(pos)
+    return blocks
+
+def date_window(dated, ordinal):
+    """Entries of a (day ordinal, value)-sorted list within the date window"""
+    lo = bisect.bisect_left(dated, (ordinal - DATE_WINDOW_DAYS,))
+    hi = bisect.bisect_left(dated, (ordinal + DATE_WINDOW_DAYS + 1,))
+    return dated[lo:hi]
+
+def _window_candidates(key, dated, keys):
+    """Values inside the item's date window that also share its category"""
+    if key['date'] is None:
+        return []
+    return [value for _, value in date_window(dated, key['date'])
+            if keys[value]['category'] == key['category']]
+
+def _sorted_by_date(found_keys):
+    """(day ordinal, position) of every dated found item, sorted for the window join"""
+    return sorted((key['date'], pos) for pos, key in enumerate(found_keys)
+                  if key['date'] is not None)
+
+def _scored_candidates(lost_key, found_keys, blocks, found_by_date):
+    """Yield (found position, score, reasons) for each match of one lost item"""
+    candidates = set(_window_candidates(lost_key, found_by_date, found_keys))
+    for block_key in _block_keys(lost_key):
+        candidates.update(blocks.get(block_key, ()))
+    
+    # Score in list order so ties keep the same ranking as a full scan
+    for pos in sorted(candidates):
+        score, reasons = score_pair(lost_key, found_keys[pos])
+        
+        # If score is high enough, it is a match
+        if score >= MATCH_THRESHOLD:
+            yield pos, score, reasons
+
+def iter_matches():
+    """
+    Yield every lost/found pair scoring at least MATCH_THRESHOLD, unsorted,
+    in lost item then found item order
+    """
+    # Closed lost items and claimed found items are never candidates
+    available = active_items('found')
+    found_keys = [_match_key(found, 'date_found') for found in available]
+    blocks = build_match_blocks(found_keys)
+    
+    found_by_date = _sorted_by_date(found_keys)
+    
+    for lost in active_items('lost'):
+        lost_key = _match_key(lost, 'date_lost')
+        for pos, score, reasons in _scored_candidates(lost_key, found_keys, blocks, found_by_date):
+            found = available[pos]
+            yield {
+                'lost_id': lost['id'],
+                'found_id': found['id'],
+                'lost_item': lost['item_name'],
+                'found_item': found['item_name'],
+                'score': score,
+                'reasons': reasons
+            }
+
+def find_matches():
+    """Return all lost/found pairs scoring at least MATCH_THRESHOLD, best first"""
+    matches = list(iter_matches())
+    matches.sort(key=lambda x: x['score'], reverse=True)
+    return matches
+
+# ==================== TOP-K MATCHING ====================
+
+MATCH_TOP_K = 3    # Default candidates kept per lost item
+MATCH_TOP_N = 20   # Default size of the global top list
+
+def find_top_matches(k=MATCH_TOP_K, top_n=MATCH_TOP_N):
+    """
+    Stream matches through bounded heaps instead of collecting them all
+    Returns (per_lost, top): per_lost is a list of (lost_id, best k matches)
+    in lost item order, top is the best top_n matches overall. Ties rank
+    in the same order as the full list. Memory is O(k x lost + top_n).
+    """
+    per_lost = {}
+    top = []
+    
+    # Heap entries are (score, -sequence, match): the root is the weakest
+    # entry, and among equal scores the one that came last
+    for seq, match in enumerate(iter_matches()):
+        entry = (match['score'], -seq, match)
+        
+        if k > 0:
+            heap = per_lost.setdefault(match['lost_id'], [])
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        
+        if top_n > 0:
+            if len(top) < top_n:
+                heapq.heappush(top, entry)
+            elif entry > top[0]:
+                heapq.heapreplace(top, entry)
+    
+    per_lost_ranked = [(lost_id, [m for _, _, m in sorted(heap, reverse=True)])
+                       for lost_id, heap in per_lost.items()]
+    top_ranked = [m for _, _, m in sorted(top, reverse=True)]
+    return per_lost_ranked, top_ranked
+
+# ==================== VECTORIZED MATCHING ENGINE ====================
+
+MATCH_ENGINE = 'vectorized'  # 'vectorized' (NumPy/pandas), 'parallel' (process pool) or 'blocked'
+MATCH_BLOCK_CELLS = 4_000_000  # Max lost x found cells scored per array block
+
+def _encode_columns(lost_values, found_values):
+    """Integer-encode a lost column and a found column against a shared code table"""
+    import pandas as pd
+    codes, _ = pd.factorize(pd.Series(lost_values + found_values, dtype=object))
+    return codes[:len(lost_values)], codes[len(lost_values):]
+
+def _encode_dates(items):
+    """Array of the items' pre-parsed day ordinals; unparseable dates become -1"""
+    import numpy as np
+    return np.array([-1 if item.date_ord is None else item.date_ord for item in items],
+                    dtype=np.int64)
+
+def _token_postings(token_lists, vocab):
+    """
+    Sparse token incidence for found items, stored column-wise:
+    the found positions containing token t are postings[starts[t]:starts[t + 1]]
+    """
+    import numpy as np
+    token_ids = []
+    positions = []
+    for pos, tokens in enumerate(token_lists):
+        for token in tokens:
+            token_ids.append(vocab.setdefault(token, len(vocab)))
+            positions.append(pos)
+    token_ids = np.array(token_ids, dtype=np.int64)
+    positions = np.array(positions, dtype=np.int64)
+    order = np.argsort(token_ids, kind='stable')
+    counts = np.bincount(token_ids, minlength=len(vocab))
+    starts = np.concatenate(([0], np.cumsum(counts)))
+    return positions[order], starts
+
+def _expand_postings(rows, tokens, postings, starts):
+    """
+    Expand (row, token) entries into every (row, found position) they hit
+    Returns (pair rows, pair found positions, index of the entry behind each pair).
+    """
+    import numpy as np
+    lengths = starts[tokens + 1] - starts[tokens]
+    total = int(lengths.sum())
+    entry = np.repeat(np.arange(len(tokens)), lengths)
+    offsets = np.repeat(starts[tokens] - (np.cumsum(lengths) - lengths), lengths)
+    return rows[entry], postings[offsets + np.arange(total)], entry
+
+def _keyword_overlap(rows, tokens, postings, starts, n_rows, n_found):
+    """Count common keywords for a block of lost items against every found item"""
+    import numpy as np
+    pair_rows, pair_found, _ = _expand_postings(rows, tokens, postings, starts)
+    overlap = np.bincount(pair_rows * n_found + pair_found, minlength=n_rows * n_found)
+    return overlap.reshape(n_rows, n_found)
+
+def _fuzzy_name_pairs(lost_names, found_names, lost_codes, found_codes,
+                      weight=FUZZY_WEIGHT, min_similarity=FUZZY_MIN_SIMILARITY, names=True):
+    """
+    Fuzzy points between distinct names: lost name code -> [(found name code, points)]
+    Found names are bucketed by LSH band, so each lost name is only compared
+    with names sharing a band. Pairs with a common keyword are left out,
+    since the exact keyword score applies to them instead. With
+    names=False (batch/ID and notes texts) every pair is scored.
+    """
+    lost_distinct = dict(zip(lost_codes.tolist(), lost_names))
+    found_distinct = dict(zip(found_codes.tolist(), found_names))
+    
+    buckets = {}
+    for code, name in found_distinct.items():
+        for band_key in name_signature(name)[1]:
+            buckets.setdefault(band_key, []).append(code)
+    
+    pairs = {}
+    for lost_code, lost_name in lost_distinct.items():
+        candidates = set()
+        for band_key in name_signature(lost_name)[1]:
+            candidates.update(buckets.get(band_key, ()))
+        keywords = set(lost_name.split()) if names else set()
+        for found_code in sorted(candidates):
+            found_name = found_distinct[found_code]
+            if keywords.intersection(found_name.split()):
+                continue
+            points, _ = fuzzy_points(lost_name, found_name, weight, min_similarity)
+            if points:
+                pairs.setdefault(lost_code, []).append((found_code, points))
+    return pairs
+
+def _fuzzy_postings(lost_texts, found_texts, weight=FUZZY_WEIGHT,
+                    min_similarity=FUZZY_MIN_SIMILARITY, names=True):
+    """
+    Fuzzy points of one text column, ready to spread over a block of items
+    Returns (lost text codes, fuzzy pairs, found text code -> posting token,
+    postings, starts); see _fuzzy_name_pairs() and _token_postings().
+    """
+    lost_codes, found_codes = _encode_columns(lost_texts, found_texts)
+    pairs = _fuzzy_name_pairs(lost_texts, found_texts, lost_codes, found_codes,
+                              weight, min_similarity, names)
+    tokens = {}
+    postings, starts = _token_postings([[code] for code in found_codes.tolist()], tokens)
+    return lost_codes, pairs, tokens, postings, starts
+
+def find_matches_vectorized():
+    """
+    Columnar version of find_matches()
+    Scores whole blocks of lost x found items with array operations and
+    returns the same ranked match list.
+    """
+    import numpy as np
+    open_lost = active_items('lost')
+    available = active_items('found')
+    if not open_lost or not available:
+        return []
+    
+    n_found = len(available)
+    lost_cat, found_cat = _encode_columns(
+        [_norm_text(x.get('category')) for x in open_lost],
+        [_norm_text(x.get('category')) for x in available])
+    lost_color, found_color = _encode_columns(
+        [_norm_text(x.get('color')) for x in open_lost],
+        [_norm_text(x.get('color')) for x in available])
+    lost_loc, found_loc = _encode_columns(
+        [_norm_text(x.get('location')) for x in open_lost],
+        [_norm_text(x.get('location')) for x in available])
+    lost_date = _encode_dates(open_lost)
+    found_date = _encode_dates(available)
+    
+    lost_names = [_norm_text(x.get('item_name')) for x in open_lost]
+    found_names = [_norm_text(x.get('item_name')) for x in available]
+    
+    # Keyword sets are deduplicated per item, exactly like the Python scorer
+    vocab = {}
+    postings, starts = _token_postings([set(name.split()) for name in found_names], vocab)
+    lost_tokens = []
+    for name in lost_names:
+        lost_tokens.append([vocab[token] for token in set(name.split()) if token in vocab])
+    
+    # Fuzzy points depend only on the two texts, so they are worked out once
+    # per distinct pair of names (or batch/IDs, or notes) and spread to items
+    # through text postings
+    fuzzy_columns = [_fuzzy_postings(lost_names, found_names)]
+    for field, (_, weight, min_similarity) in DETAIL_FIELDS.items():
+        fuzzy_columns.append(_fuzzy_postings([_detail_text(x.get(field)) for x in open_lost],
+                                             [_detail_text(x.get(field)) for x in available],
+                                             weight, min_similarity, names=False))
+    
+    hit_lost = []
+    hit_found = []
+    hit_score = []
+    block_rows = max(1, MATCH_BLOCK_CELLS // n_found)
+    
+    for lo in range(0, len(open_lost), block_rows):
+        hi = min(lo + block_rows, len(open_lost))
+        n_rows = hi - lo
+        
+        rows = np.array([r for r in range(n_rows) for _ in lost_tokens[lo + r]], dtype=np.int64)
+        tokens = np.array([t for r in range(lo, hi) for t in lost_tokens[r]], dtype=np.int64)
+        score = 30 * _keyword_overlap(rows, tokens, postings, starts, n_rows, n_found)
+        
+        for lost_codes, fuzzy_pairs, text_tokens, text_postings, text_starts in fuzzy_columns:
+            fuzzy = [(r, text_tokens[code], points) for r in range(n_rows)
+                     for code, points in fuzzy_pairs.get(int(lost_codes[lo + r]), ())]
+            if fuzzy:
+                fuzzy_rows, fuzzy_tokens, fuzzy_score = (np.array(column, dtype=np.int64)
+                                                         for column in zip(*fuzzy))
+                pair_rows, pair_found, entry = _expand_postings(fuzzy_rows, fuzzy_tokens,
+                                                                text_postings, text_starts)
+                score[pair_rows, pair_found] += fuzzy_score[entry]
+        
+        score += 25 * (lost_cat[lo:hi, None] == found_cat[None, :])
+        score += 20 * (lost_color[lo:hi, None] == found_color[None, :])
+        score += 15 * (lost_loc[lo:hi, None] == found_loc[None, :])
+        
+        block_dates = lost_date[lo:hi, None]
+        in_window = np.abs(found_date[None, :] - block_dates) <= DATE_WINDOW_DAYS
+        in_window &= (block_dates >= 0) & (found_date[None, :] >= 0)
+        score += 15 * in_window
+        
+        # np.nonzero walks the block row-major, i.e. in lost then found order
+        r, f = np.nonzero(score >= MATCH_THRESHOLD)
+        hit_lost.append(r + lo)
+        hit_found.append(f)
+        hit_score.append(score[r, f])
+    
+    hit_lost = np.concatenate(hit_lost)
+    hit_found = np.concatenate(hit_found)
+    hit_score = np.concatenate(hit_score)
+    order = np.argsort(-hit_score, kind='stable')
+    
+    # Reasons are only rendered for the pairs that made the cut
+    lost_keys = {}
+    found_keys = {}
+    matches = []
+    for i in order:
+        li = int(hit_lost[i])
+        fi = int(hit_found[i])
+        lost = open_lost[li]
+        found = available[fi]
+        if li not in lost_keys:
+            lost_keys[li] = _match_key(lost, 'date_lost')
+        if fi not in found_keys:
+            found_keys[fi] = _match_key(found, 'date_found')
+        _, reasons = score_pair(lost_keys[li], found_keys[fi])
+        matches.append({
+            'lost_id': lost['id'],
+            'found_id': found['id'],
+            'lost_item': lost['item_name'],
+            'found_item': found['item_name'],
+            'score': int(hit_score[i]),
+            'reasons': reasons
+        })
+    
+    return matches
+
+# ==================== PARALLEL MATCHING ====================
+
+MATCH_WORKERS = os.cpu_count() or 1  # Processes used by the parallel engine
+PARALLEL_MIN_PAIRS = 2_000_000       # Smaller lost x found inputs are matched serially
+
+# Per-worker copy of the available found items, set by _init_match_worker()
+_worker_state = {}
+
+def _init_match_worker(found_keys):
+    """Build the blocking index and date list once per worker process"""
+    _worker_state['found_keys'] = found_keys
+    _worker_state['blocks'] = build_match_blocks(found_keys)
+    _worker_state['found_by_date'] = _sorted_by_date(found_keys)
+
+def _match_shard(shard):
+    """Score a shard of (lost position, match key); returns (lost pos, found pos, score, reasons)"""
+    found_keys = _worker_state['found_keys']
+    blocks = _worker_state['blocks']
+    found_by_date = _worker_state['found_by_date']
+    
+    hits = []
+    for lost_pos, lost_key in shard:
+        for found_pos, score, reasons in _scored_candidates(lost_key, found_keys,
+                                                            blocks, found_by_date):
+            hits.append((lost_pos, found_pos, score, reasons))
+    return hits
+
+def find_matches_parallel(workers=None):
+    """
+    find_matches() with the open lost items sharded across a process pool
+    Workers receive only the match keys (plain sets, strings and ints) of
+    the available found items. Shards come back in lost item order, so the
+    merged list ranks exactly like the serial one. Small inputs, a single
+    worker, or a pool that cannot start fall back to the serial engine.
+    """
+    import concurrent.futures
+    
+    workers = workers or MATCH_WORKERS
+    open_lost = active_items('lost')
+    available = active_items('found')
+    if workers <= 1 or len(open_lost) * len(available) < PARALLEL_MIN_PAIRS:
+        return find_matches()
     
-    # Create new client record
-    new_client = {
-        'client_id': client_id_counter,
-        'username': username,
-        'password_hash': hash_password(password),
-        'name': name,
-        'contact': contact,
-        'email': email,
-        'registration_date': get_current_date()
-    }
+    found_keys = [_match_key(found, 'date_found') for found in available]
+    lost_keys = [(pos, _match_key(lost, 'date_lost')) for pos, lost in enumerate(open_lost)]
+    shard_size = max(1, -(-len(lost_keys) // (workers * 4)))
+    shards = [lost_keys[i:i + shard_size] for i in range(0, len(lost_keys), shard_size)]
+    
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_match_worker,
+                initargs=(found_keys,)) as pool:
+            results = list(pool.map(_match_shard, shards))
+    except (OSError, concurrent.futures.process.BrokenProcessPool):
+        return find_matches()
     
-    clients.append(new_client)
-    client_id_counter += 1
+    matches = []
+    for hits in results:
+        for lost_pos, found_pos, score, reasons in hits:
+            lost = open_lost[lost_pos]
+            found = available[found_pos]
+            matches.append({
+                'lost_id': lost['id'],
+                'found_id': found['id'],
+                'lost_item': lost['item_name'],
+                'found_item': found['item_name'],
+                'score': score,
+                'reasons': reasons
+            })
     
-    print(f"\n✓ Registration successful! Welcome, {name}!")
-    print("You can now login with your credentials.")
-    pause()
-    return True
+    matches.sort(key=lambda x: x['score'], reverse=True)
+    return matches
 
-def client_login():
-    """Client login verification"""
-    global current_client
+def run_matching(engine=None):
+    """Run smart matching with the configured engine"""
+    engine = engine or MATCH_ENGINE
+    if engine == 'parallel':
+        return find_matches_parallel()
+    if engine == 'vectorized':
+        try:
+            return find_matches_vectorized()
+        except ImportError:
+            pass  # NumPy/pandas not installed: use the pure-Python engine
+    return find_matches()
+
+# ==================== INCREMENTAL MATCHING ====================
+
+# The match table is saved with the data, so a new session (e.g. the admin
+# dashboard) starts from it instead of a batch run. Item details never
+# change after a report, only the status, so saved rows stay valid as long
+# as both items are still active; items that became active since the file
+# was written are matched incrementally when it is loaded.
+MATCH_FILE = "matches.json"  # Header line, then one JSON array of [lost_id, found_id, score, reasons]
+MATCH_FILE_FORMAT = 2  # Bump when score_pair() changes, so saved rows are re-computed
+
+def _is_active(kind, item):
+    """Open lost items and unclaimed found items take part in matching"""
+    return _norm_text(item['status']) != ('closed' if kind == 'lost' else 'claimed')
+
+def _index_for_matching(kind, item):
+    """Add an active item to the persistent blocking index"""
+    key = _match_key(item, 'date_lost' if kind == 'lost' else 'date_found')
+    match_keys[kind][item['id']] = (item, key)
+    for block_key in _block_keys(key):
+        match_blocks[kind].setdefault(block_key, set()).add(item['id'])
+    if key['date'] is not None:
+        bisect.insort(match_dates[kind], (key['date'], item['id']))
+    return key
+
+def _add_match_row(match):
+    """Store a match record in the candidate table"""
+    pair = (match['lost_id'], match['found_id'])
+    match_table[pair] = match
+    match_rows['lost'].setdefault(pair[0], set()).add(pair)
+    match_rows['found'].setdefault(pair[1], set()).add(pair)
+
+def match_new_item(kind, item):
+    """
+    Score a newly inserted item against the opposite table only
+    Returns the number of candidates added to the match table (0 while the
+    table is not seeded yet).
+    """
+    if not _is_active(kind, item):
+        return 0
+    if not match_table_ready:
+        # Seeding is a full batch run; leave it to current_matches() on the
+        # admin side, which will include this item, rather than stall a report
+        return 0
     
-    print_header("CLIENT LOGIN")
+    key = _index_for_matching(kind, item)
+    other = 'found' if kind == 'lost' else 'lost'
+    candidates = set()
+    for block_key in _block_keys(key):
+        candidates.update(match_blocks[other].get(block_key, ()))
     
-    if not clients:
-        print("⚠ No registered clients found.")
-        print("Please register first to access the portal.\n")
-        pause()
-        return False
+    # Window join: same category and a date within the window
+    if key['date'] is not None:
+        for _, other_id in date_window(match_dates[other], key['date']):
+            if match_keys[other][other_id][1]['category'] == key['category']:
+                candidates.add(other_id)
     
-    attempts = 3
-    while attempts > 0:
-        username = input("Username: ").strip()
-        password = input("Password: ").strip()
+    added = 0
+    for other_id in candidates:
+        other_item, other_key = match_keys[other][other_id]
+        if kind == 'lost':
+            lost, found = item, other_item
+            score, reasons = score_pair(key, other_key)
+        else:
+            lost, found = other_item, item
+            score, reasons = score_pair(other_key, key)
         
-        for client in clients:
-            if client['username'].lower() == username.lower():
-                if verify_password(password, client['password_hash']):
-                    current_client = client
-                    print(f"\n✓ Login successful! Welcome back, {client['name']}!")
-                    pause()
-                    return True
+        if score >= MATCH_THRESHOLD:
+            _add_match_row({
+                'lost_id': lost['id'],
+                'found_id': found['id'],
+                'lost_item': lost['item_name'],
+                'found_item': found['item_name'],
+                'score': score,
+                'reasons': reasons
+            })
+            added += 1
+    
+    return added
+
+def retire_matches(kind, item_id):
+    """Drop a closed/claimed item from the blocking index and the match table"""
+    if not match_table_ready:
+        return
+    
+    entry = match_keys[kind].pop(item_id, None)
+    if entry is not None:
+        for block_key in _block_keys(entry[1]):
+            bucket = match_blocks[kind].get(block_key)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del match_blocks[kind][block_key]
         
-        attempts -= 1
-        if attempts > 0:
-            print(f"\n✗ Invalid credentials! {attempts} attempt(s) remaining.\n")
-        else:
-            print("\n✗ Too many failed attempts. Returning to main menu.")
-            pause()
-            return False
+        date = entry[1]['date']
+        if date is not None:
+            dated = match_dates[kind]
+            pos = bisect.bisect_left(dated, (date, item_id))
+            if pos < len(dated) and dated[pos] == (date, item_id):
+                del dated[pos]
     
-    return False
+    other = 'found' if kind == 'lost' else 'lost'
+    for pair in match_rows[kind].pop(item_id, ()):
+        match_table.pop(pair, None)
+        other_id = pair[1] if kind == 'lost' else pair[0]
+        other_rows = match_rows[other].get(other_id)
+        if other_rows is not None:
+            other_rows.discard(pair)
 
-def client_logout():
-    """Logout current client"""
-    global current_client
-    current_client = None
-    print("\n✓ Logged out successfully!")
-    pause()
+def _clear_match_table():
+    """Empty the match table and the blocking index"""
+    match_table.clear()
+    for kind in ('lost', 'found'):
+        match_keys[kind].clear()
+        match_blocks[kind].clear()
+        match_rows[kind].clear()
+        match_dates[kind].clear()
 
-def require_client_login():
-    """Check if client is logged in"""
-    if current_client is None:
-        print("\n⚠ You must be logged in to access this feature!")
-        pause()
-        return False
-    return True
+def reset_match_table():
+    """Forget all candidates; the table is re-seeded the next time it is needed"""
+    global match_table_ready
+    
+    _clear_match_table()
+    match_table_ready = False
 
+def rebuild_match_table():
+    """Seed the match table with one batch run over the loaded data"""
+    global match_table_ready
+    
+    _clear_match_table()
+    for item in active_items('lost'):
+        _index_for_matching('lost', item)
+    for item in active_items('found'):
+        _index_for_matching('found', item)
+    
+    for match in run_matching():
+        _add_match_row(match)
+    match_table_ready = True
 
+def _match_params():
+    """Settings the saved match rows depend on"""
+    return [MATCH_FILE_FORMAT, MATCH_THRESHOLD, DATE_WINDOW_DAYS, FUZZY_WEIGHT,
+            FUZZY_MIN_SIMILARITY, SHINGLE_SIZE, MINHASH_PERMUTATIONS, LSH_BANDS,
+            [list(setting[1:]) for setting in DETAIL_FIELDS.values()]]
 
-# The lines of code below are drafted by Samarth Agrawal
-# ==================== ADMIN LOGIN ====================
+def save_match_table():
+    """Write the seeded match table and the items it covers to MATCH_FILE"""
+    if not match_table_ready:
+        return
+    
+    with atomic_write(MATCH_FILE) as f:
+        header = {'params': _match_params(),
+                  'lost': sorted(match_keys['lost']), 'found': sorted(match_keys['found'])}
+        f.write(json.dumps(header) + "\n")
+        # One array parses far faster than a line per row
+        json.dump([[match['lost_id'], match['found_id'], match['score'], match['reasons']]
+                   for match in match_table.values()], f)
 
-def admin_login():
-    """Admin login verification"""
-    print_header("ADMIN LOGIN")
+def load_match_table():
+    """
+    Seed the match table from MATCH_FILE instead of a batch run
+    Rows of items that are no longer active are dropped, and items that
+    became active after the file was written are matched incrementally.
+    Returns False, leaving the table unseeded, if the file is missing,
+    unreadable or was written with other matching settings.
+    """
+    global match_table_ready
     
-    attempts = 3
-    while attempts > 0:
-        username = input("Username: ").strip()
-        password = input("Password: ").strip()
-        
-        if username in admins and admins[username] == password:
-            print(f"\n✓ Login successful! Welcome, {username}!")
-            pause()
-            return True
-        else:
-            attempts -= 1
-            if attempts > 0:
-                print(f"\n✗ Invalid credentials! {attempts} attempt(s) remaining.\n")
-            else:
-                print("\n✗ Too many failed attempts. Returning to main menu.")
-                pause()
+    if not os.path.exists(MATCH_FILE):
+        return False
+    
+    _clear_match_table()
+    try:
+        with open(MATCH_FILE, encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header['params'] != _match_params():
                 return False
+            covered = {'lost': set(header['lost']), 'found': set(header['found'])}
+            
+            uncovered = []
+            for kind in ('lost', 'found'):
+                for item in active_items(kind):
+                    if item['id'] in covered[kind]:
+                        _index_for_matching(kind, item)
+                    else:
+                        uncovered.append((kind, item))
+            
+            for lost_id, found_id, score, reasons in json.load(f):
+                lost = match_keys['lost'].get(lost_id)
+                found = match_keys['found'].get(found_id)
+                if lost is None or found is None:
+                    continue
+                _add_match_row({
+                    'lost_id': lost_id,
+                    'found_id': found_id,
+                    'lost_item': lost[0]['item_name'],
+                    'found_item': found[0]['item_name'],
+                    'score': score,
+                    'reasons': reasons
+                })
+    except (OSError, ValueError, KeyError, TypeError):
+        _clear_match_table()
+        return False
     
-    return False
+    match_table_ready = True
+    for kind, item in uncovered:
+        match_new_item(kind, item)
+    return True
 
-# ==================== SMART MATCHING ====================
+def seed_match_table():
+    """Seed the match table from MATCH_FILE, or with a batch run if that is not usable"""
+    if not load_match_table():
+        rebuild_match_table()
+
+def current_matches():
+    """Ranked view of the match table (best score first)"""
+    if not match_table_ready:
+        seed_match_table()
+    return sorted(match_table.values(),
+                  key=lambda m: (-m['score'], m['lost_id'], m['found_id']))
+
+def _print_match(i, match):
+    """Print one ranked match"""
+    print(f"{i}. Match Score: {match['score']}%")
+    print(f"   Lost Item #{match['lost_id']}: {match['lost_item']}")
+    print(f"   Found Item #{match['found_id']}: {match['found_item']}")
+    print(f"   Reasons: {'; '.join(match['reasons'])}")
+    print_divider()
+
+def _read_count(prompt, default):
+    """Read a positive whole number, falling back to default"""
+    value = input(f"{prompt} (default {default}): ").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return default
 
 def match_items():
     """Match lost and found items based on keywords, date, and location"""
+    refresh_data()
+    
     print_header("SMART ITEM MATCHING")
     
     if not lost_items or not found_items:
@@ -350,110 +2455,142 @@ def match_items():
         pause()
         return
     
-    matches = []
+    print("1. All Matches (full list)")
+    print("2. Top Candidates Per Lost Item")
+    print("3. Overall Top Matches")
+    print("4. Back")
     
-    for lost in lost_items:
-        if lost['status'].lower() == 'closed':
-            continue
-            
-        for found in found_items:
-            if found['status'].lower() == 'claimed':
-                continue
-            
-            score = 0
-            reasons = []
-            
-            # Check item name similarity
-            lost_keywords = set(lost['item_name'].lower().split())
-            found_keywords = set(found['item_name'].lower().split())
-            common_keywords = lost_keywords.intersection(found_keywords)
-            
-            if common_keywords:
-                score += len(common_keywords) * 30
-                reasons.append(f"Common keywords: {', '.join(common_keywords)}")
-            
-            # Check category
-            if lost.get('category', '').lower() == found.get('category', '').lower():
-                score += 25
-                reasons.append("Same category")
-            
-            # Check color
-            if lost.get('color', '').lower() == found.get('color', '').lower():
-                score += 20
-                reasons.append("Same color")
-            
-            # Check location similarity
-            if lost['location'].lower() == found['location'].lower():
-                score += 15
-                reasons.append("Same location")
-            
-            # Check date proximity (within 7 days)
-            try:
-                lost_date = dt.strptime(lost['date_lost'], "%Y-%m-%d")
-                found_date = dt.strptime(found['date_found'], "%Y-%m-%d")
-                date_diff = abs((found_date - lost_date).days)
-                
-                if date_diff <= 7:
-                    score += 15
-                    reasons.append(f"Found within {date_diff} days")
-            except:
-                pass
-            
-            # If score is high enough, add to matches
-            if score >= 40:
-                matches.append({
-                    'lost_id': lost['id'],
-                    'found_id': found['id'],
-                    'lost_item': lost['item_name'],
-                    'found_item': found['item_name'],
-                    'score': score,
-                    'reasons': reasons
-                })
+    choice = input("\nEnter choice: ").strip()
+    
+    if choice == '1':
+        matches = current_matches()
+        
+        if matches:
+            print(f"\nFound {len(matches)} potential matches:\n")
+            for i, match in enumerate(matches, 1):
+                _print_match(i, match)
+        else:
+            print("\nNo matches found based on current criteria.")
     
-    if matches:
-        matches.sort(key=lambda x: x['score'], reverse=True)
+    elif choice == '2':
+        k = _read_count("Candidates per lost item", MATCH_TOP_K)
+        per_lost, _ = find_top_matches(k=k, top_n=0)
         
-        print(f"Found {len(matches)} potential matches:\n")
-        for i, match in enumerate(matches, 1):
-            print(f"{i}. Match Score: {match['score']}%")
-            print(f"   Lost Item #{match['lost_id']}: {match['lost_item']}")
-            print(f"   Found Item #{match['found_id']}: {match['found_item']}")
-            print(f"   Reasons: {'; '.join(match['reasons'])}")
-            print_divider()
-    else:
-        print("No matches found based on current criteria.")
+        if per_lost:
+            print(f"\nBest {k} candidate(s) for {len(per_lost)} lost item(s):\n")
+            for lost_id, matches in per_lost:
+                print(f"--- LOST ITEM #{lost_id}: {matches[0]['lost_item']} ---")
+                for i, match in enumerate(matches, 1):
+                    _print_match(i, match)
+        else:
+            print("\nNo matches found based on current criteria.")
+    
+    elif choice == '3':
+        top_n = _read_count("Number of matches to show", MATCH_TOP_N)
+        _, top = find_top_matches(k=0, top_n=top_n)
+        
+        if top:
+            print(f"\nTop {len(top)} potential matches:\n")
+            for i, match in enumerate(top, 1):
+                _print_match(i, match)
+        else:
+            print("\nNo matches found based on current criteria.")
     
     pause()
 
 
 # ==================== CHARTS & REPORTS ====================
 
+# Where charts go: 'window' (matplotlib window), 'file' (PNG/SVG under
+# CHART_DIR via the Agg backend, no display needed) or 'auto' (window only
+# when a display is available)
+CHART_MODE = os.environ.get("LOST_FOUND_CHARTS", "auto")
+CHART_FORMAT = "png"  # 'png' or 'svg'
+CHART_DIR = "charts"  # Rendered charts are cached here, named by chart_cache_key()
+
+def _chart_to_window():
+    """Whether generate_charts() should open a window instead of writing a file"""
+    if CHART_MODE != 'auto':
+        return CHART_MODE == 'window'
+    if os.name == 'nt' or sys.platform == 'darwin':
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+def _draw_chart(fig, chart_type, title, data, labels=None):
+    """Draw a bar, pie or line chart onto a matplotlib figure"""
+    ax = fig.add_subplot()
+    
+    if chart_type == 'bar':
+        ax.bar(range(len(data)), data, color='skyblue', edgecolor='navy')
+        if labels:
+            ax.set_xticks(range(len(data)))
+            ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.set_ylabel('Count')
+        
+    elif chart_type == 'pie':
+        colors_pie = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0']
+        ax.pie(data, labels=labels, autopct='%1.1f%%', colors=colors_pie, startangle=90)
+        ax.axis('equal')
+        
+    elif chart_type == 'line':
+        ax.plot(range(len(data)), data, marker='o', linestyle='-', linewidth=2, markersize=8, color='green')
+        if labels:
+            ax.set_xticks(range(len(data)))
+            ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.set_ylabel('Count')
+        ax.grid(True, alpha=0.3)
+    
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    fig.tight_layout()
+
+def chart_cache_key(chart_type, title, data, labels=None, fmt=None):
+    """Cache key of a chart: its type plus a hash of everything drawn"""
+    payload = json.dumps([title, list(data), list(labels or []), fmt or CHART_FORMAT],
+                         default=_json_default)
+    return f"{chart_type}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+def render_chart(chart_type, title, data, labels=None, fmt=None, directory=None):
+    """
+    Render a chart to a PNG/SVG file with the Agg backend and return its path
+    A chart whose type and data were rendered before (in this session or
+    an earlier one) is served from the file cache without importing
+    matplotlib.
+    """
+    fmt = fmt or CHART_FORMAT
+    directory = directory or CHART_DIR
+    path = os.path.join(directory, f"{chart_cache_key(chart_type, title, data, labels, fmt)}.{fmt}")
+    if os.path.exists(path):
+        return path
+    
+    # A bare Figure draws on the Agg canvas: no display, and no pyplot
+    # figure manager holding on to it once it goes out of scope
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 6))
+    _draw_chart(fig, chart_type, title, data, labels)
+    os.makedirs(directory, exist_ok=True)
+    # Write under a temporary name so an interrupted save never leaves a
+    # truncated file that later looks like a cache hit
+    partial = f"{path}.partial"
+    fig.savefig(partial, format=fmt)
+    fig.clear()
+    os.replace(partial, path)
+    return path
+
 def generate_charts(chart_type, title, data, labels=None):
-    """Generate matplotlib charts"""
+    """Generate matplotlib charts (a window, or a file when there is no display)"""
     try:
-        plt.figure(figsize=(10, 6))
+        if not _chart_to_window():
+            path = render_chart(chart_type, title, data, labels)
+            print(f"\n✓ Chart saved: {path}")
+            return path
         
-        if chart_type == 'bar':
-            plt.bar(range(len(data)), data, color='skyblue', edgecolor='navy')
-            if labels:
-                plt.xticks(range(len(data)), labels, rotation=45, ha='right')
-            plt.ylabel('Count')
-            
-        elif chart_type == 'pie':
-            colors_pie = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0']
-            plt.pie(data, labels=labels, autopct='%1.1f%%', colors=colors_pie, startangle=90)
-            plt.axis('equal')
-            
-        elif chart_type == 'line':
-            plt.plot(range(len(data)), data, marker='o', linestyle='-', linewidth=2, markersize=8, color='green')
-            if labels:
-                plt.xticks(range(len(data)), labels, rotation=45, ha='right')
-            plt.ylabel('Count')
-            plt.grid(True, alpha=0.3)
-        
-        plt.title(title, fontsize=14, fontweight='bold')
-        plt.tight_layout()
+        import matplotlib.pyplot as plt
+        
+        fig = plt.figure(figsize=(10, 6))
+        _draw_chart(fig, chart_type, title, data, labels)
         plt.show()
+        plt.close(fig)
         
     except Exception as e:
         print(f"✗ Error generating chart: {e}")
@@ -463,57 +2600,136 @@ def generate_charts(chart_type, title, data, labels=None):
         
 
 # The lines of code below are drafted by Tanmay Khare
-def generate_pdf_report():
-    """Generate comprehensive PDF report"""
-    print_header("GENERATE PDF REPORT")
+def summary_statistics():
+    """(metric, count) rows of the summary report"""
+    return [
+        ('Total Lost Items', len(lost_items)),
+        ('Total Found Items', len(found_items)),
+        ('Total Registered Clients', len(clients)),
+        ('Open Lost Cases', status_count('lost', 'open')),
+        ('Closed Cases', status_count('lost', 'closed')),
+        ('Pending Claims', sum(n for status, n in counts('claims', 'status') if 'Submitted' in status)),
+        ('Verified Claims', sum(n for status, n in counts('claims', 'status') if 'Verified' in status)),
+    ]
+
+# Detailed report: columns copied into the snapshot for each section
+REPORT_ITEM_FIELDS = ('id', 'item_name', 'color', 'location', 'status')
+REPORT_OPEN_CASE_FIELDS = ('id', 'item_name', 'category', 'location', 'date_lost',
+                           'reporter_name', 'reporter_contact')
+REPORT_CLAIM_FIELDS = ('claim_id', 'found_item_id', 'claimant_name', 'claimant_contact',
+                       'claim_date', 'status')
+CLAIM_CLOSED_STATUSES = {'Claimed', 'Claim Rejected'}  # Not part of the claim backlog
+REPORT_TABLE_ROWS = 200  # Rows per table flowable in the detail sections
+REPORT_CELL_CHARS = 40   # Longer cell text is cut to keep rows on one line
+
+# Background report builds: one dict per request (thread, filename, status, error)
+report_jobs = []
+
+def report_snapshot():
+    """
+    Copy what the report needs into plain tuples, so it can be laid out in
+    the background while the admin keeps changing the live records
+    """
+    def rows(items, fields):
+        return [tuple(item.get(field) for field in fields) for item in items]
     
-    try:
-        filename = f"lost_found_report_{dt.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a5490'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#2e5c8a'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
-        
+    by_category = {}
+    for label, items, date_field in (('Lost', lost_items, 'date_lost'),
+                                     ('Found', found_items, 'date_found')):
+        for item in items:
+            row = (label,) + tuple(item.get(field) for field in REPORT_ITEM_FIELDS)
+            by_category.setdefault(item.get('category') or 'Others', []).append(
+                row + (item.get(date_field),))
+    
+    return {
+        'taken': dt.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'summary': summary_statistics(),
+        'categories': sorted(by_category.items()),
+        'open_cases': rows(items_with_status('lost', 'open').values(), REPORT_OPEN_CASE_FIELDS),
+        'claim_backlog': rows((claim for claim in claims
+                               if claim['status'] not in CLAIM_CLOSED_STATUSES),
+                              REPORT_CLAIM_FIELDS)
+    }
+
+def _cell(value):
+    """Table cell text, shortened to REPORT_CELL_CHARS"""
+    text = '' if value is None else str(value)
+    if len(text) > REPORT_CELL_CHARS:
+        return text[:REPORT_CELL_CHARS - 1] + '…'
+    return text
+
+def write_pdf_report(filename=None, snapshot=None):
+    """
+    Build the PDF report (summary plus per-category items, open cases and
+    claim backlog) and return its file name. Uses a fresh snapshot unless
+    one is given. Large tables are split into REPORT_TABLE_ROWS-row tables,
+    which keeps reportlab's per-table layout memory bounded.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    snapshot = snapshot or report_snapshot()
+    filename = filename or f"lost_found_report_{dt.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    doc = SimpleDocTemplate(filename, pagesize=letter)
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a5490'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#2e5c8a'),
+        spaceAfter=12,
+        spaceBefore=12,
+        keepWithNext=1
+    )
+    
+    detail_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 7),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+    ])
+    
+    def detail_tables(header, rows):
+        """One table flowable per REPORT_TABLE_ROWS rows, each with the header"""
+        if not rows:
+            yield Paragraph("None.", styles['Normal'])
+            return
+        for start in range(0, len(rows), REPORT_TABLE_ROWS):
+            data = [header] + [[_cell(value) for value in row]
+                               for row in rows[start:start + REPORT_TABLE_ROWS]]
+            table = Table(data, repeatRows=1)
+            table.setStyle(detail_style)
+            yield table
+    
+    def story():
         # Title
-        title = Paragraph("LOST & FOUND PORTAL - SUMMARY REPORT", title_style)
-        elements.append(title)
+        yield Paragraph("LOST & FOUND PORTAL - SUMMARY REPORT", title_style)
         
         # Date
-        date_text = Paragraph(f"<b>Generated:</b> {dt.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
-        elements.append(date_text)
-        elements.append(Spacer(1, 20))
+        yield Paragraph(f"<b>Generated:</b> {snapshot['taken']}", styles['Normal'])
+        yield Spacer(1, 20)
         
         # Summary Statistics
-        elements.append(Paragraph("SUMMARY STATISTICS", heading_style))
-        
-        summary_data = [
-            ['Metric', 'Count'],
-            ['Total Lost Items', str(len(lost_items))],
-            ['Total Found Items', str(len(found_items))],
-            ['Total Registered Clients', str(len(clients))],
-            ['Open Lost Cases', str(len([x for x in lost_items if x['status'].lower() == 'open']))],
-            ['Closed Cases', str(len([x for x in lost_items if x['status'].lower() == 'closed']))],
-            ['Pending Claims', str(len([x for x in claims if 'Submitted' in x['status']]))],
-            ['Verified Claims', str(len([x for x in claims if 'Verified' in x['status']]))],
-        ]
+        yield Paragraph("SUMMARY STATISTICS", heading_style)
+        
+        summary_data = [['Metric', 'Count']]
+        summary_data += [[metric, str(count)] for metric, count in snapshot['summary']]
         
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
         summary_table.setStyle(TableStyle([
@@ -527,12 +2743,81 @@ def generate_pdf_report():
             ('GRID', (0, 0), (-1, -1), 1, colors.black)
         ]))
         
-        elements.append(summary_table)
-        elements.append(Spacer(1, 20))
+        yield summary_table
+        yield Spacer(1, 20)
+        
+        # Items per category
+        for category, rows in snapshot['categories']:
+            yield Paragraph(f"CATEGORY: {category.upper()} ({len(rows)} items)", heading_style)
+            yield from detail_tables(['Type', 'ID', 'Item', 'Color', 'Location', 'Status', 'Date'],
+                                     rows)
+        
+        yield Paragraph(f"OPEN CASES ({len(snapshot['open_cases'])})", heading_style)
+        yield from detail_tables(['ID', 'Item', 'Category', 'Location', 'Date Lost',
+                                  'Reporter', 'Contact'], snapshot['open_cases'])
         
-        # Build PDF
-        doc.build(elements)
-        print(f"\n✓ PDF Report generated successfully: {filename}")
+        yield Paragraph(f"CLAIM BACKLOG ({len(snapshot['claim_backlog'])})", heading_style)
+        yield from detail_tables(['Claim ID', 'Item ID', 'Claimant', 'Contact', 'Date', 'Status'],
+                                 snapshot['claim_backlog'])
+    
+    # Build PDF
+    doc.build(list(story()))
+    return filename
+
+def _build_report(job, snapshot):
+    """Background worker: build one report and record the outcome on its job"""
+    try:
+        write_pdf_report(job['filename'], snapshot)
+        job['status'] = 'done'
+    except Exception as e:
+        job['error'] = e
+        job['status'] = 'failed'
+
+def start_pdf_report(filename=None):
+    """Snapshot the data and build the PDF report in a background thread; returns the job"""
+    if filename is None:
+        # Two requests within a second must not write the same file
+        stamp = dt.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"lost_found_report_{stamp}.pdf"
+        taken = {job['filename'] for job in report_jobs}
+        copy = 1
+        while filename in taken or os.path.exists(filename):
+            copy += 1
+            filename = f"lost_found_report_{stamp}_{copy}.pdf"
+    job = {'filename': filename, 'status': 'running', 'error': None}
+    job['thread'] = threading.Thread(target=_build_report, args=(job, report_snapshot()),
+                                     name=f"report:{filename}")
+    report_jobs.append(job)
+    job['thread'].start()
+    return job
+
+def announce_finished_reports():
+    """Print a note for every background report that finished since the last call"""
+    for job in [job for job in report_jobs if job['status'] != 'running']:
+        if job['status'] == 'done':
+            print(f"✓ PDF Report ready: {job['filename']}")
+        else:
+            print(f"✗ Error generating PDF report {job['filename']}: {job['error']}")
+        report_jobs.remove(job)
+
+def wait_for_reports():
+    """Let reports still being built finish (called before the program exits)"""
+    for job in list(report_jobs):
+        if job['status'] == 'running':
+            print(f"Finishing PDF report {job['filename']}...")
+        job['thread'].join()
+    announce_finished_reports()
+
+def generate_pdf_report():
+    """Generate comprehensive PDF report in the background"""
+    refresh_data()
+    
+    print_header("GENERATE PDF REPORT")
+    
+    try:
+        job = start_pdf_report()
+        print(f"\n✓ Building {job['filename']} in the background.")
+        print("You can keep working; the dashboard will say when it is ready.")
         
     except Exception as e:
         print(f"✗ Error generating PDF report: {e}")
@@ -541,13 +2826,171 @@ def generate_pdf_report():
 
 
 
+# ==================== PAGED LISTINGS ====================
+
+PAGE_SIZE = 10  # Records shown per page by page_through()
+
+def page_through(rows, render, id_field='id', date_field=None, page_size=None):
+    """
+    Show records from an iterable one page at a time
+    Rows are pulled only as pages are shown, so long listings start
+    printing at once. Enter (or n) shows the next page and ends the
+    listing after the last one; p goes back, 'id <n>' and
+    'date <YYYY-MM-DD>' jump to the first matching record, q stops.
+    A listing that fits on one page is printed without a prompt.
+    Returns the number of records pulled (0 for an empty listing).
+    """
+    page_size = page_size or PAGE_SIZE
+    rows = iter(rows)
+    seen = []  # Records pulled so far, kept so earlier pages can be shown again
+    exhausted = False
+    
+    def pull(count):
+        """Pull records until `count` are cached or the rows run out"""
+        nonlocal exhausted
+        while not exhausted and len(seen) < count:
+            row = next(rows, None)
+            if row is None:
+                exhausted = True
+            else:
+                seen.append(row)
+    
+    def find(wanted):
+        """Position of the first record satisfying wanted(), or None"""
+        pos = 0
+        while True:
+            pull(pos + 1)
+            if pos >= len(seen):
+                return None
+            if wanted(seen[pos]):
+                return pos
+            pos += 1
+    
+    start = 0
+    while True:
+        # One extra record tells us whether another page follows
+        pull(start + page_size + 1)
+        end = min(start + page_size, len(seen))
+        for row in seen[start:end]:
+            render(row)
+        
+        more = len(seen) > end
+        if start == 0 and not more:
+            return len(seen)
+        
+        total = f" of {len(seen)}" if exhausted else ""
+        print(f"Showing {start + 1}-{end}{total}")
+        jumps = "id <n> | date <YYYY-MM-DD>" if date_field else "id <n>"
+        command = input(f"[Enter] next | p previous | {jumps} | q quit: ").strip().lower()
+        
+        if command in ('', 'n'):
+            if not more:
+                return len(seen)
+            start = end
+        elif command == 'p':
+            start = max(0, start - page_size)
+        elif command == 'q':
+            return len(seen)
+        elif command.startswith('id '):
+            try:
+                wanted_id = int(command[3:].strip())
+            except ValueError:
+                print("\n✗ Invalid ID!")
+                continue
+            pos = find(lambda row: row.get(id_field) == wanted_id)
+            if pos is None:
+                print(f"\n✗ ID {wanted_id} not found in this listing.")
+            else:
+                start = pos
+        elif command.startswith('date ') and date_field:
+            wanted_date = command[5:].strip()
+            if not validate_date(wanted_date):
+                print("\n✗ Invalid date format! Use YYYY-MM-DD")
+                continue
+            pos = find(lambda row: row.get(date_field) == wanted_date)
+            if pos is None:
+                print(f"\n✗ Nothing dated {wanted_date} in this listing.")
+            else:
+                start = pos
+        else:
+            print("\n✗ Invalid choice!")
+
 # ==================== CLIENT FUNCTIONS ====================
+# In kiosk mode (python test_3.py kiosk) these screens run on a terminal
+# without the data files, so the helpers below send their reads and writes
+# to the portal server instead of the local tables.
+
+def report_item(kind, item_details, location, date_value):
+    """Record the logged-in client's lost/found report; returns (item ID, new matches)"""
+    if portal_server is not None:
+        fields = {field: value for field, value in item_details.items() if field != 'description'}
+        result = portal_server.call('report', table=kind, location=location,
+                                    date=date_value, **fields)
+        return result['id'], result['new_matches']
+    item, new_matches = create_item(kind, item_details, location, date_value, current_client)
+    return item['id'], new_matches
+
+def my_records(table):
+    """The logged-in client's lost reports, found reports or claims"""
+    if portal_server is not None:
+        return portal_server.call('my_records', table=table)
+    return records_of_user(table, current_client['username'])
+
+def _server_rows(op, **fields):
+    """Every row a search/list request matches, fetched one page at a time as the pager asks"""
+    offset = 0
+    while True:
+        rows = portal_server.call(op, offset=offset, limit=SERVER_LIST_LIMIT, **fields)
+        yield from rows
+        if len(rows) < SERVER_LIST_LIMIT:
+            return
+        offset += len(rows)
+
+def list_items(table, **filters):
+    """iter_items() for the client screens"""
+    if portal_server is not None:
+        return _server_rows('list', table=table, filters=filters)
+    return iter_items(table, **filters)
+
+def find_items(table, field, keyword, status):
+    """search_text() for the client screens"""
+    if portal_server is not None:
+        if not keyword:
+            return list_items(table, status=status)  # Every item, as search_text() gives
+        return _server_rows('search', table=table, field=field, keyword=keyword)
+    return search_text(table, field, keyword, status)
+
+def submit_claim(found_id, proof):
+    """File the logged-in client's claim on a found item; returns the claim ID"""
+    global claim_id_counter
+    
+    if portal_server is not None:
+        return portal_server.call('claim', found_item_id=found_id, proof=proof)
+    
+    with data_lock():
+        # Pick up claims saved by other sessions first, so the ID is unused
+        sync_from_disk()
+        
+        # Create claim
+        claim = Claim(
+            claim_id=claim_id_counter,
+            found_item_id=found_id,
+            claimant_username=current_client['username'],
+            claimant_name=current_client['name'],
+            claimant_contact=current_client['contact'],
+            claim_date=get_current_date(),
+            status='Claim Request Submitted',
+            proof_description=proof,
+            admin_notes=''
+        )
+        
+        add_claim(claim)
+        claim_id_counter += 1
+    return claim['claim_id']
 
 def client_report_lost():
     """Client reports a lost item"""
-    global lost_id_counter
-    
-    if not require_client_login():
+    if not require_client_login() or not require_writable():
         return
     
     print_header("REPORT LOST ITEM")
@@ -566,36 +3009,17 @@ def client_report_lost():
         print("✗ Invalid date format! Using today's date.")
         date_lost = get_current_date()
     
-    # Create lost item record
-    item = {
-        'id': lost_id_counter,
-        'item_name': item_details['item_name'],
-        'category': item_details['category'],
-        'color': item_details['color'],
-        'material': item_details['material'],
-        'batch_id': item_details['batch_id'],
-        'additional_notes': item_details['additional_notes'],
-        'description': item_details['description'],
-        'location': location,
-        'date_lost': date_lost,
-        'status': 'open',
-        'reporter_username': current_client['username'],
-        'reporter_name': current_client['name'],
-        'reporter_contact': current_client['contact']
-    }
-    
-    lost_items.append(item)
-    lost_id_counter += 1
+    item_id, new_matches = report_item('lost', item_details, location, date_lost)
     
-    print(f"\n✓ Lost item reported successfully! Reference ID: {item['id']}")
+    print(f"\n✓ Lost item reported successfully! Reference ID: {item_id}")
+    if new_matches:
+        print(f"{new_matches} possible match(es) among found items flagged for admin review.")
     print("You can check the status anytime from your client dashboard.")
     pause()
 
 def client_report_found():
     """Client reports a found item"""
-    global found_id_counter
-    
-    if not require_client_login():
+    if not require_client_login() or not require_writable():
         return
     
     print_header("REPORT FOUND ITEM")
@@ -614,45 +3038,26 @@ def client_report_found():
         print("✗ Invalid date format! Using today's date.")
         date_found = get_current_date()
     
-    # Create found item record
-    item = {
-        'id': found_id_counter,
-        'item_name': item_details['item_name'],
-        'category': item_details['category'],
-        'color': item_details['color'],
-        'material': item_details['material'],
-        'batch_id': item_details['batch_id'],
-        'additional_notes': item_details['additional_notes'],
-        'description': item_details['description'],
-        'location': location,
-        'date_found': date_found,
-        'status': 'available',
-        'finder_username': current_client['username'],
-        'finder_name': current_client['name'],
-        'finder_contact': current_client['contact']
-    }
-    
-    found_items.append(item)
-    found_id_counter += 1
+    item_id, new_matches = report_item('found', item_details, location, date_found)
     
-    print(f"\n✓ Found item reported successfully! Reference ID: {item['id']}")
+    print(f"\n✓ Found item reported successfully! Reference ID: {item_id}")
+    if new_matches:
+        print(f"{new_matches} possible owner report(s) flagged for admin review.")
     print("Thank you for your honesty! The owner will be able to claim it.")
     pause()
 
 def client_view_my_reports():
     """View client's own reported items"""
+    refresh_data()
+    
     if not require_client_login():
         return
     
     print_header("MY REPORTED ITEMS")
     
-    username = current_client['username']
-    
-    # Filter lost items reported by this user
-    my_lost = [item for item in lost_items if item.get('reporter_username') == username]
-    
-    # Filter found items reported by this user
-    my_found = [item for item in found_items if item.get('finder_username') == username]
+    # Lost and found items reported by this user, from the per-user index
+    my_lost = my_records('lost')
+    my_found = my_records('found')
     
     print(f"Items reported by: {current_client['name']}\n")
     
@@ -685,6 +3090,8 @@ def client_view_my_reports():
 # The lines of code below are drafted by Parth Vats
 def client_search_items():
     """Search for items in the database"""
+    refresh_data()
+    
     if not require_client_login():
         return
     
@@ -694,31 +3101,33 @@ def client_search_items():
     print("2. Search by Category")
     print("3. Search by Color")
     print("4. View All Available Items")
-    print("5. Back")
+    print("5. Search by Description")
+    print("6. Back")
     
     choice = input("\nEnter choice: ").strip()
     
+    def brief(date_field, show_description=False):
+        """Renderer for one search result"""
+        def show(item):
+            print(f"ID: {item['id']} | {item['item_name']}")
+            if show_description:
+                print(f"   {item['description']}")
+            print(f"Date: {item[date_field]}")
+            print_divider()
+        return show
+    
     if choice == '1':
         keyword = input("Enter item name keyword: ").strip().lower()
         
         print("\n--- LOST ITEMS ---")
-        found_any = False
-        for item in lost_items:
-            if keyword in item['item_name'].lower() and item['status'].lower() == 'open':
-                print(f"ID: {item['id']} | {item['item_name']}|")
-                print(f"Date: {item['date_lost']}")
-                print_divider()
-                found_any = True
+        shown = page_through(find_items('lost', 'item_name', keyword, 'open'),
+                             brief('date_lost'), date_field='date_lost')
         
         print("\n--- FOUND ITEMS ---")
-        for item in found_items:
-            if keyword in item['item_name'].lower() and item['status'].lower() == 'available':
-                print(f"ID: {item['id']} | {item['item_name']} |")
-                print(f"Date: {item['date_found']}")
-                print_divider()
-                found_any = True
-        
-        if not found_any:
+        shown += page_through(find_items('found', 'item_name', keyword, 'available'),
+                              brief('date_found'), date_field='date_found')
+        
+        if not shown:
             print("No items found matching your search.")
     
     elif choice == '2':
@@ -726,91 +3135,79 @@ def client_search_items():
         category = input("Enter category: ").strip().lower()
         
         print("\n--- LOST ITEMS ---")
-        found_any = False
-        for item in lost_items:
-            if item.get('category', '').lower() == category and item['status'].lower() == 'open':
-                print(f"ID: {item['id']} | {item['item_name']}")
-                print(f"Date: {item['date_lost']}")
-                print_divider()
-                found_any = True
+        shown = page_through(list_items('lost', category=category, status='open'),
+                             brief('date_lost'), date_field='date_lost')
         
         print("\n--- FOUND ITEMS ---")
-        for item in found_items:
-            if item.get('category', '').lower() == category and item['status'].lower() == 'available':
-                print(f"ID: {item['id']} | {item['item_name']}")
-                print(f"Date: {item['date_found']}")
-                print_divider()
-                found_any = True
-        
-        if not found_any:
+        shown += page_through(list_items('found', category=category, status='available'),
+                              brief('date_found'), date_field='date_found')
+        
+        if not shown:
             print("No items found in this category.")
     
     elif choice == '3':
         color = input("Enter color: ").strip().lower()
         
         print("\n--- FOUND ITEMS ---")
-        found_any = False
-        for item in found_items:
-            if item.get('color', '').lower() == color and item['status'].lower() == 'available':
-                print(f"ID: {item['id']} | {item['item_name']}")
-                print(f"Date: {item['date_found']}")
-                print_divider()
-                found_any = True
-        
-        if not found_any:
+        shown = page_through(list_items('found', color=color, status='available'),
+                             brief('date_found'), date_field='date_found')
+        
+        if not shown:
             print("No items found with that color.")
     
     elif choice == '4':
         print("\n--- ALL AVAILABLE FOUND ITEMS ---")
-        available = [item for item in found_items if item['status'].lower() == 'available']
+        shown = page_through(list_items('found', status='available'),
+                             brief('date_found'), date_field='date_found')
+        
+        if not shown:
+            print("No available items at the moment.")
+    
+    elif choice == '5':
+        keyword = input("Enter keyword (e.g., leather, serial number): ").strip().lower()
+        
+        print("\n--- LOST ITEMS ---")
+        shown = page_through(find_items('lost', 'description', keyword, 'open'),
+                             brief('date_lost', show_description=True), date_field='date_lost')
         
-        if available:
-            for item in available:
-                print(f"ID: {item['id']} | {item['item_name']}")
-                print(f"Date: {item['date_found']}")
-                print_divider()
-        else:
-            print("No available items at the moment.")
+        print("\n--- FOUND ITEMS ---")
+        shown += page_through(find_items('found', 'description', keyword, 'available'),
+                              brief('date_found', show_description=True), date_field='date_found')
+        
+        if not shown:
+            print("No items found matching your search.")
     
     pause()
 
 
 def client_claim_item():
     """Client claims a found item"""
-    global claim_id_counter
-    
-    if not require_client_login():
+    if not require_client_login() or not require_writable():
         return
     
+    refresh_data()
     print_header("CLAIM AN ITEM")
     
-    # Show available found items
-    available_items = [item for item in found_items if item['status'].lower() == 'available']
+    def show(item):
+        print(f"ID: {item['id']} | {item['item_name']} | {item['category']}")
+        print(f"   Date Found: {item['date_found']}")
+        print_divider()
     
-    if not available_items:
+    # Show available found items
+    print("Available Items:\n")
+    if not page_through(list_items('found', status='available'), show, date_field='date_found'):
         print("⚠ No items available for claiming at the moment.")
         pause()
         return
     
-    print("Available Items:\n")
-    for item in available_items:
-        print(f"ID: {item['id']} | {item['item_name']} | {item['category']}")
-        print(f"   Date Found: {item['date_found']}")
-        print_divider()
-    
     found_id = input("\nEnter Found Item ID you want to claim: ").strip()
     
     try:
         found_id = int(found_id)
         
-        # Check if item exists and is available
-        item_exists = False
-        for item in found_items:
-            if item['id'] == found_id and item['status'].lower() == 'available':
-                item_exists = True
-                break
-        
-        if not item_exists:
+        # Check if item exists and is available (the server checks it in kiosk mode)
+        item = found_by_id.get(found_id)
+        if portal_server is None and (item is None or _norm_text(item['status']) != 'available'):
             print("\n✗ Item not found or not available!")
             pause()
             return
@@ -824,23 +3221,14 @@ def client_claim_item():
             pause()
             return
         
-        # Create claim
-        claim = {
-            'claim_id': claim_id_counter,
-            'found_item_id': found_id,
-            'claimant_username': current_client['username'],
-            'claimant_name': current_client['name'],
-            'claimant_contact': current_client['contact'],
-            'claim_date': get_current_date(),
-            'status': 'Claim Request Submitted',
-            'proof_description': proof,
-            'admin_notes': ''
-        }
-        
-        claims.append(claim)
-        claim_id_counter += 1
+        try:
+            claim_id = submit_claim(found_id, proof)
+        except ServerError as e:
+            print(f"\n✗ {e}!")
+            pause()
+            return
         
-        print(f"\n✓ Claim submitted successfully! Claim ID: {claim['claim_id']}")
+        print(f"\n✓ Claim submitted successfully! Claim ID: {claim_id}")
         print("Status: Claim Request Submitted")
         print("\nNext Steps:")
         print("- Admin will verify your claim")
@@ -854,22 +3242,17 @@ def client_claim_item():
 
 def client_check_claim_status():
     """Check status of claims made by logged-in client"""
+    refresh_data()
+    
     if not require_client_login():
         return
     
     print_header("MY CLAIM REQUESTS")
     
-    # Filter claims by current user
-    my_claims = [claim for claim in claims if claim.get('claimant_username') == current_client['username']]
-    
-    if not my_claims:
-        print("You have not made any claim requests yet.")
-        pause()
-        return
-    
-    print(f"Claims by: {current_client['name']}\n")
+    # Claims by current user, from the per-user index
+    my_claims = my_records('claims')
     
-    for claim in my_claims:
+    def show(claim):
         print(f"Claim ID: {claim['claim_id']}")
         print(f"Item ID: {claim['found_item_id']}")
         print(f"Status: {claim['status']}")
@@ -895,12 +3278,18 @@ def client_check_claim_status():
         
         print_divider()
     
+    print(f"Claims by: {current_client['name']}\n")
+    if not page_through(my_claims, show, id_field='claim_id', date_field='claim_date'):
+        print("You have not made any claim requests yet.")
+    
     pause()
 
 # ==================== ADMIN FUNCTIONS ====================
 
 def admin_view_all_lost():
     """View all lost items"""
+    refresh_data()
+    
     print_header("ALL LOST ITEMS")
     
     if not lost_items:
@@ -908,18 +3297,22 @@ def admin_view_all_lost():
         pause()
         return
     
-    for item in lost_items:
+    def show(item):
         print(f"ID: {item['id']} | {item['item_name']} | {item.get('category', 'N/A')}")
         print(f"   Color: {item.get('color', 'N/A')} | Material: {item.get('material', 'N/A')}")
         print(f"   Location: {item['location']} | Date: {item['date_lost']}")
         print(f"   Status: {item['status']} | Reporter: {item.get('reporter_name', 'N/A')}")
         print_divider()
     
+    page_through(lost_items, show, date_field='date_lost')
+    
     print(f"\nTotal Lost Items: {len(lost_items)}")
     pause()
 
 def admin_view_all_found():
     """View all found items"""
+    refresh_data()
+    
     print_header("ALL FOUND ITEMS")
     
     if not found_items:
@@ -927,13 +3320,15 @@ def admin_view_all_found():
         pause()
         return
     
-    for item in found_items:
+    def show(item):
         print(f"ID: {item['id']} | {item['item_name']} | {item.get('category', 'N/A')}")
         print(f"   Color: {item.get('color', 'N/A')} | Material: {item.get('material', 'N/A')}")
         print(f"   Location: {item['location']} | Date: {item['date_found']}")
         print(f"   Status: {item['status']} | Finder: {item.get('finder_name', 'N/A')}")
         print_divider()
     
+    page_through(found_items, show, date_field='date_found')
+    
     print(f"\nTotal Found Items: {len(found_items)}")
     pause()
 
@@ -947,6 +3342,8 @@ def admin_view_all_found():
 
 def admin_view_clients():
     """View all registered clients"""
+    refresh_data()
+    
     print_header("REGISTERED CLIENTS")
     
     if not clients:
@@ -954,17 +3351,21 @@ def admin_view_clients():
         pause()
         return
     
-    for client in clients:
+    def show(client):
         print(f"ID: {client['client_id']} | Username: {client['username']}")
         print(f"   Name: {client['name']} | Contact: {client['contact']}")
         print(f"   Email: {client['email']} | Registered: {client.get('registration_date', 'N/A')}")
         print_divider()
     
+    page_through(clients, show, id_field='client_id', date_field='registration_date')
+    
     print(f"\nTotal Registered Clients: {len(clients)}")
     pause()
 
 def admin_manage_claims():
     """View and manage all claims with status workflow"""
+    refresh_data()
+    
     print_header("MANAGE CLAIMS")
     
     if not claims:
@@ -973,14 +3374,16 @@ def admin_manage_claims():
         return
     
     # Show all claims
-    print("ALL CLAIMS:\n")
-    for claim in claims:
+    def show(claim):
         print(f"Claim ID: {claim['claim_id']} | Item ID: {claim['found_item_id']}")
         print(f"   Claimant: {claim['claimant_name']} | Contact: {claim['claimant_contact']}")
         print(f"   Status: {claim['status']} | Date: {claim['claim_date']}")
         print(f"   Proof: {claim.get('proof_description', 'N/A')}")
         print_divider()
     
+    print("ALL CLAIMS:\n")
+    page_through(claims, show, id_field='claim_id', date_field='claim_date')
+    
     print("\nCLAIM MANAGEMENT OPTIONS:")
     print("1. Update Claim Status")
     print("2. Back")
@@ -988,58 +3391,40 @@ def admin_manage_claims():
     choice = input("\nEnter choice: ").strip()
     
     if choice == '1':
+        if not require_writable():
+            return
         claim_id = input("\nEnter Claim ID to update: ").strip()
         
         try:
             claim_id = int(claim_id)
-            claim_found = False
+            claim = claims_by_id.get(claim_id)
             
-            for claim in claims:
-                if claim['claim_id'] == claim_id:
-                    claim_found = True
-                    
-                    print(f"\nCurrent Status: {claim['status']}")
-                    print("\nUpdate to:")
-                    print("1. Claim Verified")
-                    print("2. Not Verified")
-                    print("3. Collect From SWF Office")
-                    print("4. Claimed (Item Collected)")
-                    print("5. Claim Rejected")
-                    
-                    status_choice = input("\nEnter choice (1-5): ").strip()
+            if claim is None:
+                print(f"\n✗ Claim ID {claim_id} not found.")
+            else:
+                print(f"\nCurrent Status: {claim['status']}")
+                print("\nUpdate to:")
+                print("1. Claim Verified")
+                print("2. Not Verified")
+                print("3. Collect From SWF Office")
+                print("4. Claimed (Item Collected)")
+                print("5. Claim Rejected")
+                
+                status_choice = input("\nEnter choice (1-5): ").strip()
+                
+                if status_choice in CLAIM_STATUSES:
+                    old_status = claim['status']
+                    notes = None
                     
-                    status_map = {
-                        '1': 'Claim Verified',
-                        '2': 'Not Verified',
-                        '3': 'Collect From SWF Office',
-                        '4': 'Claimed',
-                        '5': 'Claim Rejected'
-                    }
+                    # Get admin notes for rejections
+                    if status_choice in ['2', '5']:
+                        notes = input("Enter reason for rejection/not verified: ").strip()
                     
-                    if status_choice in status_map:
-                        old_status = claim['status']
-                        claim['status'] = status_map[status_choice]
-                        
-                        # Get admin notes for rejections
-                        if status_choice in ['2', '5']:
-                            notes = input("Enter reason for rejection/not verified: ").strip()
-                            claim['admin_notes'] = notes
-                        
-                        # Update found item status if claimed
-                        if status_choice == '4':
-                            for item in found_items:
-                                if item['id'] == claim['found_item_id']:
-                                    item['status'] = 'claimed'
-                                    break
-                        
-                        print(f"\n✓ Claim #{claim_id} updated: {old_status} → {claim['status']}")
-                    else:
-                        print("\n✗ Invalid choice!")
+                    apply_claim_status(claim, CLAIM_STATUSES[status_choice], notes)
                     
-                    break
-            
-            if not claim_found:
-                print(f"\n✗ Claim ID {claim_id} not found.")
+                    print(f"\n✓ Claim #{claim_id} updated: {old_status} → {claim['status']}")
+                else:
+                    print("\n✗ Invalid choice!")
         
         except ValueError:
             print("\n✗ Invalid Claim ID!")
@@ -1048,32 +3433,37 @@ def admin_manage_claims():
 
 def admin_close_case():
     """Mark a lost item case as closed"""
+    refresh_data()
+    
     print_header("CLOSE LOST ITEM CASE")
     
-    # Show open cases
-    open_cases = [item for item in lost_items if item['status'].lower() == 'open']
+    if not require_writable():
+        return
     
-    if not open_cases:
+    # Show open cases
+    if not items_with_status('lost', 'open'):
         print("No open cases to close.")
         pause()
         return
     
-    print("Open Cases:\n")
-    for item in open_cases:
+    def show(item):
         print(f"ID: {item['id']} | {item['item_name']} | {item.get('category', 'N/A')}")
         print(f"   Reporter: {item.get('reporter_name', 'N/A')} | Date: {item['date_lost']}")
         print_divider()
     
+    print("Open Cases:\n")
+    page_through(iter_items('lost', status='open'), show, date_field='date_lost')
+    
     item_id = input("\nEnter Lost Item ID to close: ").strip()
     
     try:
         item_id = int(item_id)
-        for item in lost_items:
-            if item['id'] == item_id:
-                item['status'] = 'closed'
-                print(f"\n✓ Case #{item_id} closed successfully!")
-                pause()
-                return
+        item = lost_by_id.get(item_id)
+        if item is not None:
+            set_lost_status(item, 'closed')
+            print(f"\n✓ Case #{item_id} closed successfully!")
+            pause()
+            return
         
         print(f"\n✗ Item #{item_id} not found.")
     except ValueError:
@@ -1083,33 +3473,36 @@ def admin_close_case():
 
 def admin_analytics():
     """Generate analytics and charts"""
+    refresh_data()
+    
     print_header("ANALYTICS & REPORTS")
     
     print("1. Items Lost Per Category")
     print("2. Items Found Per Category")
     print("3. Lost vs Found Comparison")
     print("4. Claim Status Distribution")
-    print("5. Back")
+    print("5. Verify Analytics Counters")
+    print("6. Back")
     
     choice = input("\nEnter choice: ").strip()
     
+    def show_counts(values):
+        for value, count in values:
+            print(f"   {value or 'N/A'}: {count}")
+    
     if choice == '1':
         if not lost_items:
             print("\n⚠ No lost items data available.")
             pause()
             return
         
-        df = pd.DataFrame(lost_items)
-        if 'category' in df.columns:
-            category_counts = df['category'].value_counts()
-            print("\nItems Lost Per Category:")
-            print(category_counts)
-            
-            generate_charts('bar', 'Items Lost Per Category', 
-                          category_counts.values.tolist(), 
-                          category_counts.index.tolist())
-        else:
-            print("\n⚠ Category information not available.")
+        category_counts = counts('lost', 'category')
+        print("\nItems Lost Per Category:")
+        show_counts(category_counts)
+        
+        generate_charts('bar', 'Items Lost Per Category', 
+                      [count for _, count in category_counts], 
+                      [category for category, _ in category_counts])
     
     elif choice == '2':
         if not found_items:
@@ -1117,17 +3510,13 @@ def admin_analytics():
             pause()
             return
         
-        df = pd.DataFrame(found_items)
-        if 'category' in df.columns:
-            category_counts = df['category'].value_counts()
-            print("\nItems Found Per Category:")
-            print(category_counts)
-            
-            generate_charts('bar', 'Items Found Per Category', 
-                          category_counts.values.tolist(), 
-                          category_counts.index.tolist())
-        else:
-            print("\n⚠ Category information not available.")
+        category_counts = counts('found', 'category')
+        print("\nItems Found Per Category:")
+        show_counts(category_counts)
+        
+        generate_charts('bar', 'Items Found Per Category', 
+                      [count for _, count in category_counts], 
+                      [category for category, _ in category_counts])
     
     elif choice == '3':
         total_lost = len(lost_items)
@@ -1151,15 +3540,23 @@ def admin_analytics():
             pause()
             return
         
-        df = pd.DataFrame(claims)
-        status_counts = df['status'].value_counts()
+        status_counts = counts('claims', 'status')
         
         print("\nClaim Status Distribution:")
-        print(status_counts)
+        show_counts(status_counts)
         
         generate_charts('pie', 'Claim Status Distribution', 
-                      status_counts.values.tolist(), 
-                      status_counts.index.tolist())
+                      [count for _, count in status_counts], 
+                      [status for status, _ in status_counts])
+    
+    elif choice == '5':
+        mismatched = verify_analytics()
+        if mismatched:
+            for table, dimension in mismatched:
+                print(f"\n⚠ {table} counts per {dimension} were out of date")
+            print("\n✓ Counters rebuilt from the data.")
+        else:
+            print("\n✓ Analytics counters match the data.")
     
     pause()
 
@@ -1168,6 +3565,7 @@ def admin_dashboard():
     while True:
         clear_screen()
         print_header("ADMIN DASHBOARD")
+        announce_finished_reports()
         
         print("1.  View All Lost Items")
         print("2.  View All Found Items")
@@ -1253,22 +3651,27 @@ def client_portal():
             
             choice = input("\nEnter choice (1-7): ").strip()
             
-            if choice == '1':
-                client_report_lost()
-            elif choice == '2':
-                client_report_found()
-            elif choice == '3':
-                client_view_my_reports()
-            elif choice == '4':
-                client_search_items()
-            elif choice == '5':
-                client_claim_item()
-            elif choice == '6':
-                client_check_claim_status()
-            elif choice == '7':
-                client_logout()
-            else:
-                print("\n✗ Invalid choice!")
+            try:
+                if choice == '1':
+                    client_report_lost()
+                elif choice == '2':
+                    client_report_found()
+                elif choice == '3':
+                    client_view_my_reports()
+                elif choice == '4':
+                    client_search_items()
+                elif choice == '5':
+                    client_claim_item()
+                elif choice == '6':
+                    client_check_claim_status()
+                elif choice == '7':
+                    client_logout()
+                else:
+                    print("\n✗ Invalid choice!")
+                    pause()
+            except ServerError as e:
+                # Kiosk mode: the server refused one of the screen's requests
+                print(f"\n✗ {e}!")
                 pause()
 # # The lines of code below are drafted by Samarth Agrawal
 # ==================== MAIN PROGRAM ====================
@@ -1298,6 +3701,7 @@ def main():
         elif choice == '2':
             client_portal()
         elif choice == '3':
+            wait_for_reports()
             # Save data before exit
             print("\nSaving data...")
             save_data()
@@ -1310,7 +3714,927 @@ def main():
             print("\n✗ Invalid choice! Please try again.")
             pause()
 
+# ==================== STARTUP TIME ====================
+
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'reportlab')
+
+def measure_startup(runs=5):
+    """
+    Time a cold start (module import + load_data) in fresh interpreters
+    and report any heavy module that got imported on the way
+    """
+    import subprocess
+    
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    probe = (
+        "import contextlib, io, sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})\n"
+        f"import {module}\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        f"    {module}.load_data()\n"
+        "elapsed = time.perf_counter() - t0\n"
+        f"print(elapsed, ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules), sep='|')\n"
+    )
+    
+    timings = []
+    heavy = set()
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", probe],
+                                capture_output=True, text=True, check=True)
+        elapsed, loaded = result.stdout.strip().split("\n")[-1].split('|')
+        timings.append(float(elapsed) * 1000)
+        heavy.update(filter(None, loaded.split(',')))
+    
+    timings.sort()
+    print(f"Startup (import + load_data) over {runs} run(s): "
+          f"min {timings[0]:.1f} ms, median {timings[len(timings) // 2]:.1f} ms")
+    if heavy:
+        print(f"⚠ Heavy modules imported at startup: {', '.join(sorted(heavy))}")
+    else:
+        print("✓ No heavy modules imported at startup.")
+    return timings
+
+# ==================== COMMAND LINE ====================
+# Headless subcommands for bulk work, e.g.
+#   python test_3.py import lost term_end.csv --name "SWF Office"
+#   python test_3.py match matches.csv --top-k 3
+#   python test_3.py update-claims decisions.jsonl
+#   python test_3.py report summary.pdf
+#   python test_3.py charts --format svg
+
+def read_rows(filename):
+    """
+    Iterate (position, row) over a .csv, .jsonl or .json (array) file
+    position reads "Line n", or "Item n" in a JSON array. JSON-lines rows
+    come unparsed: pass every row through row_dict() inside the per-row
+    error handling. Raises ValueError if a .json file is not an array.
+    """
+    if filename.lower().endswith('.json'):
+        with open(filename, encoding='utf-8') as f:
+            try:
+                rows = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"{filename} is not valid JSON ({e})") from None
+        if not isinstance(rows, list):
+            raise ValueError(f"{filename} must hold a JSON array of objects")
+        return ((f"Item {item_no}", row) for item_no, row in enumerate(rows, 1))
+    return _read_lines(filename)
+
+def _read_lines(filename):
+    """Yield (position, row) from a .csv or .jsonl file"""
+    with open(filename, newline='', encoding='utf-8') as f:
+        if filename.lower().endswith('.jsonl'):
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    yield f"Line {line_no}", line
+        else:
+            # Line 1 is the header
+            for line_no, row in enumerate(_csv_rows(csv.DictReader(f)), 2):
+                yield f"Line {line_no}", row
+
+def row_dict(row):
+    """A row from read_rows() as a dict; raises ValueError for bad CSV or JSON or a non-object"""
+    if row is None:
+        raise ValueError("row could not be parsed as CSV")
+    if isinstance(row, str):
+        try:
+            row = json.loads(row)
+        except ValueError as e:
+            raise ValueError(f"invalid JSON ({e})") from None
+    if not isinstance(row, dict):
+        raise ValueError("row must be a JSON object")
+    return row
+
+def write_rows(filename, fieldnames, rows):
+    """Write row dicts to a .csv, .jsonl or .json (array) file, chosen by extension"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        if filename.lower().endswith('.json'):
+            json.dump(list(rows), f, default=_json_default, indent=1)
+            f.write("\n")
+        elif filename.lower().endswith('.jsonl'):
+            for row in rows:
+                f.write(json.dumps(row, default=_json_default) + "\n")
+        else:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+def _text(row, field, default=''):
+    """Stripped text of a row field (missing or null becomes default)"""
+    value = row.get(field)
+    return default if value is None else str(value).strip() or default
+
+def item_from_row(kind, row):
+    """
+    Validate one import row; returns (item details, location, date)
+    The date column may be named date_lost/date_found or just date, and
+    defaults to today. Raises ValueError with the reason for bad rows.
+    """
+    item_name = _text(row, 'item_name')
+    if not item_name:
+        raise ValueError("item_name is required")
+    
+    date_field = 'date_lost' if kind == 'lost' else 'date_found'
+    date_value = _text(row, date_field) or _text(row, 'date') or get_current_date()
+    if not validate_date(date_value):
+        raise ValueError(f"invalid date {date_value!r} (use YYYY-MM-DD)")
+    
+    item_details = build_item_details(item_name, _text(row, 'category'), _text(row, 'color'),
+                                      _text(row, 'material'), _text(row, 'batch_id'),
+                                      _text(row, 'additional_notes'))
+    return item_details, _text(row, 'location'), date_value
+
+def cli_import(args):
+    """Bulk-import lost or found items; bad rows are reported and skipped"""
+    person_field = 'reporter' if args.kind == 'lost' else 'finder'
+    imported = 0
+    rejected = 0
+    
+    try:
+        rows = read_rows(args.file)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+    
+    for position, row in rows:
+        try:
+            row = row_dict(row)
+            item_details, location, date_value = item_from_row(args.kind, row)
+        except ValueError as e:
+            print(f"✗ {position}: {e}")
+            rejected += 1
+            continue
+        
+        # Per-row reporter/finder columns override the command-line defaults
+        person = {
+            'username': _text(row, f'{person_field}_username', args.username),
+            'name': _text(row, f'{person_field}_name', args.name),
+            'contact': _text(row, f'{person_field}_contact', args.contact)
+        }
+        create_item(args.kind, item_details, location, date_value, person)
+        imported += 1
+    
+    print(f"✓ Imported {imported} {args.kind} item(s) from {args.file}")
+    if rejected:
+        print(f"⚠ Skipped {rejected} invalid row(s)")
+    return 1 if rejected else 0
+
+MATCH_FIELDS = ['lost_id', 'found_id', 'lost_item', 'found_item', 'score', 'reasons']
+
+def cli_match(args):
+    """Run smart matching and write the matches to a file"""
+    if args.top_k:
+        per_lost, _ = find_top_matches(k=args.top_k, top_n=0)
+        matches = [match for _, lost_matches in per_lost for match in lost_matches]
+    else:
+        matches = run_matching(args.engine)
+    
+    if not args.output.lower().endswith(('.jsonl', '.json')):
+        matches = [dict(match, reasons='; '.join(match['reasons'])) for match in matches]
+    write_rows(args.output, MATCH_FIELDS, matches)
+    print(f"✓ Wrote {len(matches)} match(es) to {args.output}")
+    return 0
+
+def cli_update_claims(args):
+    """Apply claim status updates (claim_id, status, admin_notes) from a file"""
+    statuses = {status.lower(): status for status in CLAIM_STATUSES.values()}
+    updated = 0
+    rejected = 0
+    
+    try:
+        rows = read_rows(args.file)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+    
+    for position, row in rows:
+        try:
+            row = row_dict(row)
+        except ValueError as e:
+            print(f"✗ {position}: {e}")
+            rejected += 1
+            continue
+        
+        status = _text(row, 'status')
+        status = CLAIM_STATUSES.get(status) or statuses.get(status.lower())
+        try:
+            claim = claims_by_id.get(int(_text(row, 'claim_id')))
+        except ValueError:
+            claim = None
+        
+        if claim is None:
+            print(f"✗ {position}: unknown claim_id {row.get('claim_id')!r}")
+        elif status is None:
+            print(f"✗ {position}: unknown status {row.get('status')!r}")
+        else:
+            apply_claim_status(claim, status, _text(row, 'admin_notes') or None)
+            updated += 1
+            continue
+        rejected += 1
+    
+    print(f"✓ Updated {updated} claim(s) from {args.file}")
+    if rejected:
+        print(f"⚠ Skipped {rejected} invalid row(s)")
+    return 1 if rejected else 0
+
+def cli_report(args):
+    """Export the summary report as PDF, CSV or JSON lines"""
+    if args.output.lower().endswith('.pdf'):
+        write_pdf_report(args.output)
+    else:
+        rows = [{'metric': metric, 'count': count} for metric, count in summary_statistics()]
+        write_rows(args.output, ['metric', 'count'], rows)
+    print(f"✓ Report written to {args.output}")
+    return 0
+
+def cli_startup_time(args):
+    """Measure cold-start time (same as --startup-time)"""
+    measure_startup()
+    return 0
+
+def analytics_charts():
+    """(chart type, title, data, labels) of every analytics chart, from the live counters"""
+    charts = []
+    for table, title in (('lost', 'Items Lost Per Category'), ('found', 'Items Found Per Category')):
+        category_counts = counts(table, 'category')
+        charts.append(('bar', title, [n for _, n in category_counts],
+                       [category for category, _ in category_counts]))
+    charts.append(('pie', 'Lost vs Found Items Comparison',
+                   [len(lost_items), len(found_items)], ['Lost Items', 'Found Items']))
+    status_counts = counts('claims', 'status')
+    charts.append(('pie', 'Claim Status Distribution', [n for _, n in status_counts],
+                   [status for status, _ in status_counts]))
+    days = sorted(day for day in analytics['lost']['day'] if validate_date(str(day)))
+    charts.append(('line', 'Lost Items Reported Per Day',
+                   [analytics['lost']['day'][day] for day in days], days))
+    return charts
+
+def cli_charts(args):
+    """Render every analytics chart with data to files (cached by content)"""
+    for chart_type, title, data, labels in analytics_charts():
+        if not any(data):
+            continue
+        path = render_chart(chart_type, title, data, labels, fmt=args.format, directory=args.dir)
+        print(f"✓ {title}: {path}")
+    return 0
+
+def build_parser():
+    """Argument parser for the headless subcommands"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Smart Lost & Found Portal (headless mode)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    importer = commands.add_parser('import', help="bulk-import lost or found items from CSV/JSONL/JSON")
+    importer.add_argument('kind', choices=['lost', 'found'])
+    importer.add_argument('file')
+    importer.add_argument('--username', default='admin',
+                          help="reporter/finder username for rows without one")
+    importer.add_argument('--name', default='SWF Office',
+                          help="reporter/finder name for rows without one")
+    importer.add_argument('--contact', default='N/A',
+                          help="reporter/finder contact for rows without one")
+    importer.set_defaults(func=cli_import, saves=True)
+    
+    matcher = commands.add_parser('match', help="run smart matching and write the results")
+    matcher.add_argument('output', help=".csv, .jsonl or .json file")
+    matcher.add_argument('--engine', choices=['blocked', 'vectorized', 'parallel'])
+    matcher.add_argument('--top-k', type=int, default=0,
+                         help="keep only the best K matches per lost item")
+    matcher.set_defaults(func=cli_match, saves=False)
+    
+    updater = commands.add_parser('update-claims', help="apply claim status updates from CSV/JSONL/JSON")
+    updater.add_argument('file')
+    updater.set_defaults(func=cli_update_claims, saves=True)
+    
+    reporter = commands.add_parser('report', help="export the summary report")
+    reporter.add_argument('output', help=".pdf, .csv, .jsonl or .json file")
+    reporter.set_defaults(func=cli_report, saves=False)
+    
+    charts = commands.add_parser('charts', help="render the analytics charts to PNG/SVG files")
+    charts.add_argument('--format', choices=['png', 'svg'], default=CHART_FORMAT)
+    charts.add_argument('--dir', default=CHART_DIR)
+    charts.set_defaults(func=cli_charts, saves=False)
+    
+    startup = commands.add_parser('startup-time', help="measure cold-start time")
+    startup.set_defaults(func=cli_startup_time, saves=False, loads=False)
+    
+    server = commands.add_parser('serve', help="serve the data to terminal clients over TCP")
+    server.add_argument('--host', default=SERVER_HOST)
+    server.add_argument('--port', type=int, default=SERVER_PORT)
+    server.set_defaults(func=cli_serve, saves=True)
+    
+    client = commands.add_parser('client', help="send one request to a running server")
+    client.add_argument('op', choices=sorted(SERVER_OPS))
+    client.add_argument('fields', nargs='*', help="request fields as field=value")
+    client.add_argument('--host', default=SERVER_HOST)
+    client.add_argument('--port', type=int, default=SERVER_PORT)
+    client.add_argument('--user', help="log in as this client first")
+    client.add_argument('--admin', help="log in as this admin first")
+    client.add_argument('--password', default='')
+    client.set_defaults(func=cli_client, saves=False, loads=False)
+    
+    kiosk = commands.add_parser('kiosk', help="run the client portal against a running server")
+    kiosk.add_argument('--host', default=SERVER_HOST)
+    kiosk.add_argument('--port', type=int, default=SERVER_PORT)
+    kiosk.set_defaults(func=cli_kiosk, saves=False, loads=False)
+    
+    simulate = commands.add_parser('simulate', help="load-test a local server with concurrent clients")
+    simulate.add_argument('--clients', type=int, default=8)
+    simulate.add_argument('--admins', type=int, default=2)
+    simulate.add_argument('--ops', type=int, default=50, help="requests per client")
+    simulate.set_defaults(func=cli_simulate, saves=False, loads=False)
+    
+    return parser
+
+def run_cli(argv):
+    """Run one headless subcommand; returns the process exit status"""
+    if argv[:1] == ['--startup-time']:
+        argv = ['startup-time'] + argv[1:]
+    args = build_parser().parse_args(argv)
+    
+    if getattr(args, 'loads', True):
+        load_data()
+        if load_failed and args.saves:
+            print(f"✗ '{args.command}' changes the data, so it cannot run in a read-only session.")
+            return 1
+    status = args.func(args)
+    if args.saves and not save_data():
+        status = 1
+    return status
+
+# ==================== NETWORK SERVER ====================
+# One long-running process owns the data and every kiosk talks to it over
+# TCP, one JSON object per line in each direction:
+#   -> {"op": "search", "table": "found", "field": "item_name", "keyword": "wallet"}
+#   <- {"ok": true, "result": [...]}   or   {"ok": false, "error": "..."}
+#   python test_3.py serve --port 8765
+#   python test_3.py client search table=found keyword=wallet --user amy --password secret
+#   python test_3.py kiosk --port 8765    (the client portal menus, through the server)
+#   python test_3.py simulate --clients 8 --ops 50
+# Requests run on a single asyncio event loop, so the synchronous steps of
+# one handler never interleave with another's. Handlers that change a table
+# still hold that table's lock, which keeps check-then-write steps atomic
+# while any handler is waiting, e.g. on matching or saving in a worker thread.
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_LIST_LIMIT = 50  # Default number of records returned by search/list
+TABLE_LOCK_ORDER = ('clients', 'lost', 'found', 'claims')  # Locks are always taken in this order
+
+server_loop = None  # Event loop running the server
+table_locks = {}    # table -> asyncio.Lock, created by start_server()
+
+class ServerError(Exception):
+    """A request the server refused; the message comes from the server"""
+
+@contextlib.asynccontextmanager
+async def locked(*tables):
+    """Hold the locks of the given tables (taken in TABLE_LOCK_ORDER, so no deadlocks)"""
+    async with contextlib.AsyncExitStack() as stack:
+        for table in TABLE_LOCK_ORDER:
+            if table in tables:
+                await stack.enter_async_context(table_locks[table])
+        yield
+
+def _field(request, name, default=None):
+    """Stripped text of a request field; raises ValueError if required and missing"""
+    value = _text(request, name)
+    if value:
+        return value
+    if default is None:
+        raise ValueError(f"{name} is required")
+    return default
+
+def _request_id(request, name):
+    """Integer ID field of a request"""
+    try:
+        return int(request[name])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer") from None
+
+def _request_table(request, tables=('lost', 'found')):
+    """Table named by a request, restricted to the given tables"""
+    table = request.get('table')
+    if table not in tables:
+        raise ValueError(f"table must be one of {', '.join(tables)}")
+    return table
+
+# Item columns shown to clients, as on the old search and claim screens;
+# reporter/finder names and contacts are returned to admins only
+PUBLIC_ITEM_FIELDS = {
+    'lost': ('id', 'item_name', 'category', 'description', 'date_lost'),
+    'found': ('id', 'item_name', 'category', 'description', 'date_found')
+}
+
+def _visible(session, table, rows):
+    """Rows as returned to this session: whole records for admins, public fields otherwise"""
+    if session['admin']:
+        return list(rows)
+    fields = PUBLIC_ITEM_FIELDS[table]
+    return [{field: row[field] for field in fields} for row in rows]
+
+def _limited(rows, request):
+    """At most 'limit' rows (after skipping 'offset') as a list"""
+    import itertools
+    
+    offset = max(_request_id(request, 'offset') if 'offset' in request else 0, 0)
+    limit = _request_id(request, 'limit') if 'limit' in request else SERVER_LIST_LIMIT
+    return list(itertools.islice(rows, offset, offset + max(limit, 0)))
+
+async def op_ping(session, request):
+    """Liveness check"""
+    return 'pong'
+
+async def op_register(session, request):
+    """Register a client account; returns the new client ID"""
+    global client_id_counter
+    
+    username = _field(request, 'username')
+    password = _field(request, 'password')
+    if len(password) < 4:
+        raise ValueError("Password must be at least 4 characters long")
+    
+    async with locked('clients'):
+        with data_lock():
+            # Other processes may share the data files (see sync_from_disk())
+            sync_from_disk()
+            if find_client(username) is not None:
+                raise ValueError("Username already exists")
+            client = Client(
+                client_id=client_id_counter,
+                username=username,
+                password_hash=hash_password(password),
+                name=_field(request, 'name', username),
+                contact=_field(request, 'contact', 'N/A'),
+                email=_text(request, 'email'),
+                registration_date=get_current_date()
+            )
+            add_client(client)
+            client_id_counter += 1
+    return client['client_id']
+
+async def op_login(session, request):
+    """Log the connection in as a client"""
+    client = find_client(_field(request, 'username'))
+    if client is None or not verify_password(_field(request, 'password'), client['password_hash']):
+        raise ValueError("Invalid credentials")
+    session['client'] = client
+    return {'username': client['username'], 'name': client['name']}
+
+async def op_admin_login(session, request):
+    """Log the connection in as an admin"""
+    username = _field(request, 'username')
+    if admins.get(username) != _field(request, 'password'):
+        raise ValueError("Invalid credentials")
+    session['admin'] = username
+    return {'username': username}
+
+async def op_report(session, request):
+    """Report a lost or found item (same fields as an import row)"""
+    kind = _request_table(request)
+    item_details, location, date_value = item_from_row(kind, request)
+    
+    async with locked(kind):
+        item, new_matches = create_item(kind, item_details, location, date_value,
+                                        session['client'])
+    return {'id': item['id'], 'new_matches': new_matches}
+
+async def op_search(session, request):
+    """Open lost / available found items whose name or description contains keyword"""
+    table = _request_table(request)
+    field = request.get('field', 'item_name')
+    if field not in ('item_name', 'description'):
+        raise ValueError("field must be item_name or description")
+    status = 'open' if table == 'lost' else 'available'
+    rows = _limited(search_text(table, field, _field(request, 'keyword'), status), request)
+    return _visible(session, table, rows)
+
+async def op_list(session, request):
+    """Records of a table whose fields equal the given 'filters' (admins see every table)"""
+    if session['admin']:
+        table = _request_table(request, ('lost', 'found', 'claims', 'clients'))
+        filterable = set(TABLE_FIELDS[table])
+    else:
+        table = _request_table(request)
+        filterable = set(PUBLIC_ITEM_FIELDS[table]) | {'status', 'color'}  # As the search screen
+    filters = request.get('filters') or {}
+    if not isinstance(filters, dict) or not set(filters) <= filterable:
+        raise ValueError(f"filters must map {table} fields ({', '.join(sorted(filterable))}) to values")
+    rows = iter_items(table, **{field: str(value) for field, value in filters.items()})
+    return _visible(session, table, _limited(rows, request))
+
+async def op_get(session, request):
+    """One lost or found item by ID"""
+    table = _request_table(request)
+    item = (lost_by_id if table == 'lost' else found_by_id).get(_request_id(request, 'id'))
+    if item is None:
+        raise ValueError(f"{table} item not found")
+    return _visible(session, table, [item])[0]
+
+async def op_my_records(session, request):
+    """The logged-in client's lost reports, found reports or claims"""
+    table = _request_table(request, ('lost', 'found', 'claims'))
+    return records_of_user(table, session['client']['username'])
+
+async def op_claim(session, request):
+    """Claim an available found item; returns the claim ID"""
+    global claim_id_counter
+    
+    found_id = _request_id(request, 'found_item_id')
+    proof = _field(request, 'proof')
+    if len(proof) < 10:
+        raise ValueError("Please provide more detailed proof of ownership")
+    
+    async with locked('found', 'claims'):
+        with data_lock():
+            sync_from_disk()
+            item = found_by_id.get(found_id)
+            if item is None or _norm_text(item['status']) != 'available':
+                raise ValueError("Item not found or not available")
+            client = session['client']
+            claim = Claim(
+                claim_id=claim_id_counter,
+                found_item_id=found_id,
+                claimant_username=client['username'],
+                claimant_name=client['name'],
+                claimant_contact=client['contact'],
+                claim_date=get_current_date(),
+                status='Claim Request Submitted',
+                proof_description=proof,
+                admin_notes=''
+            )
+            add_claim(claim)
+            claim_id_counter += 1
+    return claim['claim_id']
+
+async def op_claim_status(session, request):
+    """
+    Move a claim to a new status (name, or menu number 1-5)
+    If 'expect' is given the update only applies while the claim still has
+    that status, so two admins deciding the same claim cannot overwrite
+    each other. An item already collected cannot be marked Claimed again.
+    """
+    statuses = {status.lower(): status for status in CLAIM_STATUSES.values()}
+    status = _field(request, 'status')
+    status = CLAIM_STATUSES.get(status) or statuses.get(status.lower())
+    if status is None:
+        raise ValueError(f"unknown status {request['status']!r}")
+    
+    async with locked('found', 'claims'):
+        claim = claims_by_id.get(_request_id(request, 'claim_id'))
+        if claim is None:
+            raise ValueError("Claim not found")
+        if 'expect' in request and claim['status'] != request['expect']:
+            raise ValueError(f"Claim is now {claim['status']!r}, not {request['expect']!r}")
+        if status == 'Claimed':
+            item = found_by_id.get(claim['found_item_id'])
+            if item is not None and _norm_text(item['status']) == 'claimed':
+                raise ValueError(f"Item #{item['id']} has already been claimed")
+        apply_claim_status(claim, status, _text(request, 'admin_notes') or None)
+    return claim
+
+async def op_close_case(session, request):
+    """Mark a lost item case as closed"""
+    async with locked('lost'):
+        item = lost_by_id.get(_request_id(request, 'id'))
+        if item is None:
+            raise ValueError("Lost item not found")
+        set_lost_status(item, 'closed')
+    return item
+
+async def op_matches(session, request):
+    """
+    Ranked smart-match candidates from the incremental match table
+    Reports update the table as they are filed, so only the first request
+    (or the first after a reload) waits for it to be seeded.
+    """
+    if not match_table_ready:
+        # Seeding reads every table in a worker thread, so hold off writes
+        # (and the reloads their sync_from_disk() may do) until it is done
+        async with locked(*TABLE_LOCK_ORDER):
+            if not match_table_ready:
+                await server_loop.run_in_executor(None, seed_match_table)
+    return current_matches()
+
+async def op_stats(session, request):
+    """Summary statistics as {metric: count}"""
+    return dict(summary_statistics())
+
+async def op_save(session, request):
+    """Write a full snapshot while every table is locked"""
+    async with locked(*TABLE_LOCK_ORDER):
+        if STORAGE_BACKEND == 'sqlite':
+            # The SQLite connection belongs to the event loop thread
+            saved = save_data()
+        else:
+            saved = await server_loop.run_in_executor(None, save_data)
+    if not saved:
+        raise ValueError("Could not save data")
+    return True
+
+# op -> (handler, login required: None, 'any' (client or admin), 'client' or 'admin')
+SERVER_OPS = {
+    'ping': (op_ping, None),
+    'register': (op_register, None),
+    'login': (op_login, None),
+    'admin_login': (op_admin_login, None),
+    'search': (op_search, 'any'),
+    'list': (op_list, 'any'),
+    'get': (op_get, 'any'),
+    'stats': (op_stats, None),
+    'report': (op_report, 'client'),
+    'my_records': (op_my_records, 'client'),
+    'claim': (op_claim, 'client'),
+    'claim_status': (op_claim_status, 'admin'),
+    'close_case': (op_close_case, 'admin'),
+    'matches': (op_matches, 'admin'),
+    'save': (op_save, 'admin')
+}
+
+async def handle_request(session, line):
+    """Run one request line; returns the response dict"""
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        handler, access = SERVER_OPS.get(request.get('op'), (None, None))
+        if handler is None:
+            raise ValueError(f"unknown op {request.get('op')!r}")
+        if access == 'any' and session['client'] is None and session['admin'] is None:
+            raise ValueError("login required")
+        if access in ('client', 'admin') and session[access] is None:
+            raise ValueError(f"{access} login required")
+        return {'ok': True, 'result': await handler(session, request)}
+    except ValueError as e:
+        return {'ok': False, 'error': str(e)}
+    except Exception as e:
+        # A bug in one request must not take the server down
+        return {'ok': False, 'error': f"internal error: {e!r}"}
+
+async def handle_connection(reader, writer):
+    """Serve one client connection until it disconnects"""
+    session = {'client': None, 'admin': None}
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Line longer than the stream limit
+                writer.write(b'{"ok": false, "error": "request too long"}\n')
+                break
+            if not line:
+                break
+            response = await handle_request(session, line)
+            writer.write(json.dumps(response, default=_json_default).encode('utf-8') + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def start_server(host=SERVER_HOST, port=SERVER_PORT):
+    """Start listening on the running event loop; returns the asyncio server"""
+    import asyncio
+    global server_loop
+    
+    server_loop = asyncio.get_running_loop()
+    for table in TABLE_LOCK_ORDER:
+        table_locks[table] = asyncio.Lock()
+    return await asyncio.start_server(handle_connection, host, port)
+
+class PortalClient:
+    """Blocking connection to the portal server; call(op, **fields) returns the result"""
+    
+    def __init__(self, host=SERVER_HOST, port=SERVER_PORT, timeout=60):
+        import socket
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.sock.makefile('rwb')
+    
+    def call(self, op, **fields):
+        """Send one request; raises ServerError if the server refuses it"""
+        self.stream.write(json.dumps(dict(fields, op=op)).encode('utf-8') + b"\n")
+        self.stream.flush()
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        response = json.loads(line)
+        if not response['ok']:
+            raise ServerError(response['error'])
+        return response['result']
+    
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+def cli_serve(args):
+    """Serve the portal to terminal clients until interrupted"""
+    import asyncio
+    import signal
+    
+    async def serve():
+        server = await start_server(args.host, args.port)
+        stopped = asyncio.Event()
+        try:
+            # Stop cleanly (and save) when a service manager sends SIGTERM
+            server_loop.add_signal_handler(signal.SIGTERM, stopped.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C only
+        print(f"✓ Serving on {args.host}:{server.sockets[0].getsockname()[1]} (Ctrl+C to stop)")
+        async with server:
+            await stopped.wait()
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print()
+    print("✓ Server stopped")
+    return 0
+
+def _cli_value(text):
+    """A field=value argument's value: JSON if it parses (numbers, lists), else the text"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+def cli_client(args):
+    """Send one request to a running server and print the result"""
+    fields = {}
+    for pair in args.fields:
+        name, sep, value = pair.partition('=')
+        if not sep:
+            print(f"✗ Expected field=value, got {pair!r}")
+            return 2
+        fields[name] = _cli_value(value)
+    
+    client = PortalClient(args.host, args.port)
+    try:
+        if args.admin:
+            client.call('admin_login', username=args.admin, password=args.password)
+        elif args.user:
+            client.call('login', username=args.user, password=args.password)
+        result = client.call(args.op, **fields)
+    except ServerError as e:
+        print(f"✗ {e}")
+        return 1
+    finally:
+        client.close()
+    
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+def cli_kiosk(args):
+    """Client portal menus for a kiosk terminal, working through a running server"""
+    global portal_server
+    
+    try:
+        portal_server = PortalClient(args.host, args.port)
+    except OSError as e:
+        print(f"✗ Cannot reach the server at {args.host}:{args.port}: {e}")
+        return 1
+    try:
+        client_portal()
+    except ConnectionError:
+        print("\n✗ Lost the connection to the server.")
+        return 1
+    finally:
+        portal_server.close()
+        portal_server = None
+    return 0
+
+SIMULATED_ITEMS = ['Wallet', 'Backpack', 'iPhone 13', 'Water Bottle', 'ID Card',
+                   'Umbrella', 'Calculator', 'Laptop Charger', 'Notebook', 'Earphones']
+SIMULATED_COLORS = ['black', 'blue', 'red', 'grey', 'white']
+
+def simulated_client(port, number, ops, seed):
+    """One kiosk: register, then a random mix of reports, searches and claims"""
+    rng = random.Random(seed)
+    client = PortalClient(port=port)
+    done = {'requests': 2, 'lost': 0, 'found': 0, 'claims': 0, 'refused': 0}
+    username = f"kiosk{number}"
+    try:
+        client.call('register', username=username, password='kiosk-pass',
+                    name=f"Kiosk {number}", contact='N/A')
+        client.call('login', username=username, password='kiosk-pass')
+        
+        for _ in range(ops):
+            action = rng.choice(('lost', 'found', 'found', 'search', 'claim', 'mine'))
+            done['requests'] += 1
+            try:
+                if action in ('lost', 'found'):
+                    client.call('report', table=action, item_name=rng.choice(SIMULATED_ITEMS),
+                                category=rng.choice('abcdef'), color=rng.choice(SIMULATED_COLORS),
+                                location=f"Block {rng.randint(1, 5)}")
+                    done[action] += 1
+                elif action == 'search':
+                    client.call('search', table=rng.choice(('lost', 'found')),
+                                keyword=rng.choice(SIMULATED_ITEMS)[:4])
+                elif action == 'claim':
+                    available = client.call('list', table='found',
+                                            filters={'status': 'available'}, limit=20)
+                    if available:
+                        client.call('claim', found_item_id=rng.choice(available)['id'],
+                                    proof=f"Mine, with my initials K{number} inside")
+                        done['claims'] += 1
+                else:
+                    client.call('my_records', table='claims')
+            except ServerError:
+                # Another kiosk won a race (e.g. the item was claimed meanwhile)
+                done['refused'] += 1
+    finally:
+        client.close()
+    return done
+
+def simulated_admin(port, rounds, seed):
+    """An admin deciding pending claims while the kiosks work"""
+    import time
+    
+    rng = random.Random(seed)
+    client = PortalClient(port=port)
+    done = {'requests': 1, 'decided': 0, 'refused': 0}
+    try:
+        client.call('admin_login', username='admin', password=admins['admin'])
+        for _ in range(rounds):
+            pending = client.call('list', table='claims',
+                                  filters={'status': 'Claim Request Submitted'}, limit=10)
+            done['requests'] += 1
+            for claim in pending:
+                done['requests'] += 1
+                try:
+                    client.call('claim_status', claim_id=claim['claim_id'],
+                                status=rng.choice(('Claimed', 'Claim Rejected')),
+                                expect='Claim Request Submitted')
+                    done['decided'] += 1
+                except ServerError:
+                    done['refused'] += 1
+            time.sleep(0.01)
+    finally:
+        client.close()
+    return done
+
+def cli_simulate(args):
+    """
+    Run a server and several concurrent kiosk clients against an empty
+    store in a scratch directory, then check that no update was lost
+    """
+    import asyncio
+    import tempfile
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    
+    async def simulate():
+        server = await start_server(SERVER_HOST, 0)
+        port = server.sockets[0].getsockname()[1]
+        with ThreadPoolExecutor(max_workers=args.clients + args.admins) as pool:
+            jobs = [server_loop.run_in_executor(pool, simulated_client, port, n, args.ops, n)
+                    for n in range(1, args.clients + 1)]
+            jobs += [server_loop.run_in_executor(pool, simulated_admin, port, args.ops, -n)
+                     for n in range(1, args.admins + 1)]
+            results = await asyncio.gather(*jobs)
+        server.close()
+        await server.wait_closed()
+        return results
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            start = time.perf_counter()
+            results = asyncio.run(simulate())
+            elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+    
+    kiosks, admin_runs = results[:args.clients], results[args.clients:]
+    total = collections.Counter()
+    for done in results:
+        total.update(done)
+    print(f"✓ {args.clients} kiosk(s) and {args.admins} admin(s) made {total['requests']} "
+          f"requests in {elapsed:.2f}s ({total['requests'] / elapsed:.0f}/s)")
+    print(f"  {total['refused']} request(s) refused after losing a race")
+    
+    claimed = collections.Counter(claim['found_item_id'] for claim in claims
+                                  if claim['status'] == 'Claimed')
+    checks = [
+        ("every registration kept", len(clients) == args.clients),
+        ("every lost report kept", len(lost_by_id) == len(lost_items) == total['lost']),
+        ("every found report kept", len(found_by_id) == len(found_items) == total['found']),
+        ("every claim kept", len(claims_by_id) == len(claims) == total['claims']),
+        ("every admin decision kept", sum(claim['status'] != 'Claim Request Submitted'
+                                          for claim in claims) == total['decided']),
+        ("no item claimed twice", all(n == 1 for n in claimed.values())),
+        ("analytics counters consistent", not verify_analytics())
+    ]
+    for label, passed in checks:
+        print(f"{'✓' if passed else '✗'} {label}")
+    return 0 if all(passed for _, passed in checks) else 1
+
 # ==================== PROGRAM START ====================
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    else:
+        main()